@@ -1,6 +1,75 @@
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING
 
 try:
     __version__ = importlib.metadata.version(__package__ or __name__)
 except importlib.metadata.PackageNotFoundError:
     __version__ = "unknown version"
+
+# Public classes are resolved on first attribute access (PEP 562), so that
+# `import pymetatree` does not pay for importing RDKit, rdchiral or enviPath up front.
+_LAZY_ATTRIBUTES = {
+    "Blueprint": "pymetatree.blueprint.models",
+    "BlueprintHandler": "pymetatree.blueprint.blueprint_handler",
+    "BlueprintSubstructureSearch": "pymetatree.blueprint.substructure_search",
+    "ChemicalReaction": "pymetatree.data_handling.models",
+    "ConvertRxnToSmarts": "pymetatree.chemoinformatics.reaction_data_convertor",
+    "ConvertSmartsToRxn": "pymetatree.chemoinformatics.reaction_data_convertor",
+    "EawagDataHandler": "pymetatree.data_handling.data_handler",
+    "MappingManager": "pymetatree.data_handling.mapping_manager",
+    "Molecule": "pymetatree.data_handling.models",
+    "ReadRxn": "pymetatree.chemoinformatics.reaction_data_reader",
+    "ReadSmarts": "pymetatree.chemoinformatics.reaction_data_reader",
+    "Template": "pymetatree.template.models",
+    "TemplateConstructor": "pymetatree.template.constructors",
+    "WriteRxn": "pymetatree.chemoinformatics.reaction_data_writer",
+    "WritesSmarts": "pymetatree.chemoinformatics.reaction_data_writer",
+}
+
+__all__ = [
+    "__version__",
+    "Blueprint",
+    "BlueprintHandler",
+    "BlueprintSubstructureSearch",
+    "ChemicalReaction",
+    "ConvertRxnToSmarts",
+    "ConvertSmartsToRxn",
+    "EawagDataHandler",
+    "MappingManager",
+    "Molecule",
+    "ReadRxn",
+    "ReadSmarts",
+    "Template",
+    "TemplateConstructor",
+    "WriteRxn",
+    "WritesSmarts",
+]
+
+if TYPE_CHECKING:
+    from pymetatree.blueprint.blueprint_handler import BlueprintHandler
+    from pymetatree.blueprint.models import Blueprint
+    from pymetatree.blueprint.substructure_search import BlueprintSubstructureSearch
+    from pymetatree.chemoinformatics.reaction_data_convertor import (
+        ConvertRxnToSmarts,
+        ConvertSmartsToRxn,
+    )
+    from pymetatree.chemoinformatics.reaction_data_reader import ReadRxn, ReadSmarts
+    from pymetatree.chemoinformatics.reaction_data_writer import WriteRxn, WritesSmarts
+    from pymetatree.data_handling.data_handler import EawagDataHandler
+    from pymetatree.data_handling.mapping_manager import MappingManager
+    from pymetatree.data_handling.models import ChemicalReaction, Molecule
+    from pymetatree.template.constructors import TemplateConstructor
+    from pymetatree.template.models import Template
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
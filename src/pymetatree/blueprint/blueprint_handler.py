@@ -10,9 +10,11 @@ Usage:
 2. Use the provided methods to manipulate the Blueprint and execute reactions.
 """
 import logging
-from typing import Optional, List
+from functools import partial
+from typing import Callable, Optional, List
 from rdkit import Chem
-from pymetatree.chemoinformatics.functions import rdrxn_from_string, rdmol_from_string
+from rdkit.Chem import rdChemReactions
+from pymetatree.chemoinformatics.functions import rdmol_from_string
 from pymetatree.blueprint.models import Blueprint, ReactionComponent, ChemicalClass
 from pymetatree.data_handling.models import ChemicalReaction, Molecule
 
@@ -55,6 +57,9 @@ class BlueprintHandler:
         """
         Build a list of ReactionComponent objects from a list of Molecule objects.
 
+        The Molecule objects are already validated, so the components are built without
+        running pydantic validation again.
+
         Args:
             components (List[Molecule]): A list of Molecule objects.
 
@@ -62,9 +67,9 @@ class BlueprintHandler:
             List[ReactionComponent]: A list of ReactionComponent objects.
         """
         return [
-            ReactionComponent(
+            ReactionComponent.model_construct(
                 name=component.name,
-                chemical_classes=ChemicalClass(
+                chemical_classes=ChemicalClass.model_construct(
                     name=component.name,
                     smarts=component.smiles,
                 )
@@ -80,23 +85,42 @@ class BlueprintHandler:
             Blueprint: The Blueprint object.
 
         Raises:
-            ValueError: If the ChemicalReaction object is not present.
+            ValueError: If the ChemicalReaction object or its template is not present.
         """
         if self.chemical_reaction is None:
             raise ValueError("ChemicalReaction object must be provided to build the blueprint.")
-        reactants = self._build_components(self.chemical_reaction.reactants)
-        products = self._build_components(self.chemical_reaction.products)
+        return self.generate(self.chemical_reaction)
+
+    @classmethod
+    def generate(cls, chemical_reaction: ChemicalReaction) -> Blueprint:
+        """
+        Build a Blueprint object from a ChemicalReaction object, without creating a handler.
+
+        The ChemicalReaction object is already validated, so the Blueprint is built without
+        running pydantic validation again.
+
+        Args:
+            chemical_reaction (ChemicalReaction): The chemical reaction object.
+
+        Returns:
+            Blueprint: The Blueprint object.
+
+        Raises:
+            ValueError: If the ChemicalReaction object has no template.
+        """
+        if chemical_reaction.template is None:
+            raise ValueError("ChemicalReaction must have a template to build the blueprint.")
         components = {
-            "reactants": reactants,
-            "products": products
+            "reactants": cls._build_components(chemical_reaction.reactants),
+            "products": cls._build_components(chemical_reaction.products)
         }
-        return Blueprint(
+        return Blueprint.model_construct(
             components=components,
-            description=self.chemical_reaction.description,
-            name=self.chemical_reaction.name,
-            namerxn_reaction_class=self.chemical_reaction.namerxn_reaction_class,
-            namerxn_reaction_numbers=self.chemical_reaction.namerxn_reaction_numbers,
-            templates=[self.chemical_reaction.template]
+            description=chemical_reaction.description,
+            name=chemical_reaction.name,
+            namerxn_reaction_class=chemical_reaction.namerxn_reaction_class,
+            namerxn_reaction_numbers=chemical_reaction.namerxn_reaction_numbers,
+            templates=[chemical_reaction.template]
         )
 
     def add_new_reaction(self, new_reaction: ChemicalReaction) -> None:
@@ -144,10 +168,7 @@ class BlueprintHandler:
         if template_index < 0 or template_index >= len(self.blueprint.templates):
             raise IndexError("Template index out of range.")
         template = self.blueprint.templates[template_index]
-        if reaction_direction == "forward":
-            self._rdrxn = rdrxn_from_string(template.template_fwd_smarts, "smarts")
-        elif reaction_direction == "backward":
-            self._rdrxn = rdrxn_from_string(template.template_rwd_smarts, "smarts")
+        self._rdrxn = template.rxn_fwd if reaction_direction == "forward" else template.rxn_rwd
 
     def run_reaction(self, template_index: int, reaction_direction: str, molecules: List[str]) -> Chem.Mol:
         """
@@ -156,24 +177,55 @@ class BlueprintHandler:
         Args:
             template_index (int): The index of the template to be used.
             reaction_direction (str): The direction of the reaction ("forward" or "backward").
-            molecules (List[Chem.Mol]): A list of RDKit molecule objects.
+            molecules (List[str]): A list of SMILES strings.
 
         Returns:
-            List[Chem.Mol]: A list of resulting molecules after the reaction.
+            Chem.Mol: The first product of the reaction.
 
         Raises:
-            ValueError: If no molecules are provided.
+            ValueError: If no molecules are provided or if a molecule is not a string.
+        """
+        return self.compile(template_index, reaction_direction)(molecules)
+
+    def compile(self, template_index: int, reaction_direction: str) -> Callable[[List[str]], Chem.Mol]:
+        """
+        Bind a template and direction into a reusable reaction runner.
+
+        The returned callable behaves like run_reaction for the given template and direction,
+        including its validation of the molecules, without re-activating the template on every call.
+
+        Args:
+            template_index (int): The index of the template to be used.
+            reaction_direction (str): The direction of the reaction ("forward" or "backward").
+
+        Returns:
+            Callable[[List[str]], Chem.Mol]: A function taking a list of SMILES strings and returning
+            the first product of the reaction.
+
+        Raises:
+            ValueError: If the reaction_direction is not "forward" or "backward".
+            IndexError: If the template_index is out of range.
         """
-        if molecules is None or not molecules:
-            raise ValueError("Molecules must be provided to run the reaction.")
-        activated_molecules = [self.activate_molecule(molecule) for molecule in molecules]
-        molecules_tuple = tuple(activated_molecules)
         self.activate_template(template_index, reaction_direction)
+        return partial(self._run_compiled, self._rdrxn)
+
+    @staticmethod
+    def _run_compiled(rdrxn: rdChemReactions.ChemicalReaction, molecules: List[str]) -> Chem.Mol:
+        """
+        Run an activated reaction on a list of SMILES strings and return its first product.
+
+        Raises:
+            ValueError: If no molecules are provided or if a molecule is not a string.
+            RuntimeError: If the reaction cannot be run on the molecules.
+        """
+        if not molecules:
+            raise ValueError("Molecules must be provided to run the reaction.")
+        if not all(isinstance(molecule, str) for molecule in molecules):
+            raise ValueError("Molecule must be an instance of str.")
         try:
-            result = self._rdrxn.RunReactants(molecules_tuple)[0][0]
-            return result
+            return rdrxn.RunReactants(tuple(map(Chem.MolFromSmiles, molecules)), maxProducts=1)[0][0]
         except Exception as e:
-            logger.error(f"Error running the reaction: {e}")
+            logger.error("Error running the reaction: %s", e)
             raise RuntimeError(f"Error running the reaction: {e}")
 
     @staticmethod
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, computed_field
 from typing import Dict, List, Optional
 from pymetatree.template.models import Template
 from pymetatree.chemoinformatics.functions import hash_string
+from pymetatree.model_cache import cached_on_key
 
 
 class ChemicalClass(BaseModel):
@@ -28,8 +29,5 @@ class Blueprint(BaseModel):
     @computed_field
     @property
     def uid(self) -> str:
-        sorted_templates = sorted(self.templates, key=lambda t: t.uid)
-        templates_uid = ""
-        for template in sorted_templates:
-            templates_uid += template.uid
-        return hash_string(templates_uid)
+        template_uids = tuple(template.uid for template in self.templates)
+        return cached_on_key(self, "_uid_cache", template_uids, lambda: hash_string("".join(sorted(template_uids))))
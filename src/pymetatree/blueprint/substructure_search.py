@@ -1,5 +1,7 @@
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from rdkit import Chem
+from rdkit.Chem import rdSubstructLibrary
 
 from pymetatree.chemoinformatics.functions import rdmol_from_string
 from pymetatree.blueprint.exceptions import InvalidSmilesError, SubstructureSearchError
@@ -9,9 +11,36 @@ class BlueprintSubstructureSearch:
     """
     A class to search for blueprints that contain a given substructure.
     """
-    def __init__(self, blueprint_dataset: List[Dict]):
+    def __init__(self, blueprint_dataset: List[Dict], n_jobs: int = 1, sanitize: bool = True):
+        """
+        Initialize the BlueprintSubstructureSearch with a blueprint dataset.
+
+        Args:
+            blueprint_dataset (List[Dict]): The blueprints to search, as dictionaries.
+            n_jobs (int, optional): The number of threads RDKit uses to parse and match the blueprints.
+                Defaults to 1.
+            sanitize (bool, optional): Whether to sanitize the blueprint and query molecules. Skipping it
+                is faster, but aromaticity is not perceived, so it is only suitable for trusted SMILES
+                written in the same form as the queries. Defaults to True.
+
+        Raises:
+            ValueError: If n_jobs is not a positive integer.
+            SubstructureSearchError: If a SMILES string of the dataset cannot be parsed.
+        """
+        if not isinstance(n_jobs, int) or n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer.")
         self.blueprint_dataset = blueprint_dataset
+        self.n_jobs = n_jobs
+        self.sanitize = sanitize
         self.smiles_dict = self._extract_smiles_from_dataset()
+        self._library = rdSubstructLibrary.SubstructLibrary(
+            rdSubstructLibrary.MolHolder(), rdSubstructLibrary.PatternHolder()
+        )
+        self._blueprint_rows: Dict[str, List[int]] = {}
+        # The default parameters leave chirality and query-query matching off; the keyword overload of
+        # GetMatches would enable chirality instead.
+        self._match_parameters = Chem.SubstructMatchParameters()
+        self._build_search_index()
 
     def _extract_smiles_from_dataset(self) -> Dict[str, List[str]]:
         """
@@ -32,10 +61,58 @@ class BlueprintSubstructureSearch:
             smiles_with_uids[blueprint_uid] = smiles_list
         return smiles_with_uids
 
+    def _build_search_index(self) -> None:
+        """
+        Parse each unique SMILES string of the dataset into an RDKit substructure library, once.
+
+        The library holds one row per unique SMILES, with its molecule and pattern fingerprint.
+        `_blueprint_rows` maps every blueprint UID to the rows of its molecules, so SMILES shared by
+        several blueprints are parsed and screened a single time.
+
+        Raises:
+            SubstructureSearchError: If RDKit cannot parse a SMILES string of the dataset.
+        """
+        unique_smiles = list(dict.fromkeys(
+            smiles for smiles_list in self.smiles_dict.values() for smiles in smiles_list
+        ))
+        rows: Dict[str, Optional[int]] = {
+            smiles: None if mol is None else self._library.AddMol(mol)
+            for smiles, mol in zip(unique_smiles, self._parse_smiles(unique_smiles))
+        }
+        for blueprint_uid, smiles_list in self.smiles_dict.items():
+            invalid_smiles = [smiles for smiles in smiles_list if rows[smiles] is None]
+            if invalid_smiles:
+                raise SubstructureSearchError(
+                    f"Invalid SMILES string in blueprint {blueprint_uid}: {', '.join(invalid_smiles)}"
+                )
+            self._blueprint_rows[blueprint_uid] = [rows[smiles] for smiles in smiles_list]
+
+    def _parse_smiles(self, smiles_list: List[str]) -> List[Optional[Chem.Mol]]:
+        """
+        Parse SMILES strings into RDKit molecules, in a thread pool when more than one job is requested.
+
+        Args:
+            smiles_list (List[str]): The SMILES strings to parse.
+
+        Returns:
+            List[Optional[Chem.Mol]]: The molecules, in the same order as the SMILES strings,
+                with None for the SMILES that RDKit cannot parse.
+        """
+        def parse(smiles: str) -> Optional[Chem.Mol]:
+            return rdmol_from_string(smiles, 'smiles', self.sanitize)
+
+        if self.n_jobs == 1 or len(smiles_list) < 2:
+            return list(map(parse, smiles_list))
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            return list(executor.map(parse, smiles_list))
+
     def search(self, query_smiles: str) -> List[str]:
         """
         Search for blueprints that contain the given substructure.
 
+        The query is matched against RDKit's substructure library, which screens the candidate
+        molecules with pattern fingerprints before running the full substructure match.
+
         Args:
             query_smiles (str): The SMILES string representing the substructure.
 
@@ -47,35 +124,17 @@ class BlueprintSubstructureSearch:
             SubstructureSearchError: If any other error occurs during the substructure search process.
         """
         try:
-            query_mol = rdmol_from_string(query_smiles, 'smiles')
+            query_mol = rdmol_from_string(query_smiles, 'smiles', self.sanitize)
             if query_mol is None:
                 raise InvalidSmilesError(f"Invalid SMILES string: {query_smiles}")
-            matched_blueprints = [
-                blueprint_uid
-                for blueprint_uid, smiles_list in self.smiles_dict.items()
-                if any(self._has_substructure(smile, query_mol) for smile in smiles_list)
+            if not len(self._library):
+                return []
+            matched = set(self._library.GetMatches(
+                query_mol, self._match_parameters, numThreads=self.n_jobs, maxResults=-1
+            ))
+            return [
+                blueprint_uid for blueprint_uid, blueprint_rows in self._blueprint_rows.items()
+                if not matched.isdisjoint(blueprint_rows)
             ]
-            return matched_blueprints
         except Exception as e:
             raise SubstructureSearchError(f"An error occurred during the substructure search: {str(e)}") from e
-
-    @staticmethod
-    def _has_substructure(smiles: str, query_mol: Chem.Mol) -> bool:
-        """
-        Check if a given SMILES string contains the substructure represented by the query molecule.
-
-        Args:
-            smiles (str): The SMILES string to check.
-            query_mol (Chem.Mol): The query molecule representing the substructure.
-
-        Returns:
-            bool: True if the SMILES string contains the substructure, False otherwise.
-
-        Raises:
-            SubstructureSearchError: If any error occurs during the substructure check.
-        """
-        try:
-            mol = rdmol_from_string(smiles, 'smiles')
-            return mol.HasSubstructMatch(query_mol)
-        except Exception as e:
-            raise SubstructureSearchError(f"An error occurred while checking substructure for SMILES: {smiles}") from e
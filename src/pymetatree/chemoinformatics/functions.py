@@ -1,7 +1,6 @@
-import copy
 import hashlib
-from functools import partial
-from typing import Optional, List, Dict
+from functools import lru_cache, partial
+from typing import Optional, Iterable, List, Dict
 
 from rdkit import Chem
 from rdkit.Chem import rdChemReactions
@@ -10,19 +9,49 @@ from pymetatree.chemoinformatics.exceptions import (
     ExceptionRxnStringFormatInvalid,
     ExceptionMolStringFormatInvalid,
     ExceptionRdrxnStringFormatInvalid,
-    ExceptionHashing,
 )
 
 HashValue = Optional[str]
 
-
-def rdmol_from_string(input_string: str, input_format: str) -> Chem.Mol:
+_MOL_CONVERTERS = {
+    "smiles": Chem.MolFromSmiles,
+    "smarts": Chem.MolFromSmarts,
+    "molblock": Chem.MolFromMolBlock,
+}
+
+_RXN_CONVERTERS = {
+    "smiles": partial(Chem.rdChemReactions.ReactionFromSmarts, useSmiles=True),
+    "smarts": partial(Chem.rdChemReactions.ReactionFromSmarts, useSmiles=False),
+    "rxn_block": Chem.rdChemReactions.ReactionFromRxnBlock,
+}
+
+_RXN_WRITERS = {
+    "smiles": partial(Chem.rdChemReactions.ReactionToSmiles, canonical=True),
+    "smarts": Chem.rdChemReactions.ReactionToSmarts,
+    "rxn": partial(
+        Chem.rdChemReactions.ReactionToRxnBlock,
+        forceV3000=True,
+        separateAgents=True,
+    ),
+    "rxn_blockV2K": Chem.rdChemReactions.ReactionToRxnBlock,
+    "rxn_blockV3K": partial(
+        Chem.rdChemReactions.ReactionToV3KRxnBlock, separateAgents=True
+    ),
+}
+
+
+def rdmol_from_string(input_string: str, input_format: str, sanitize: bool = True) -> Chem.Mol:
     """
     Generate an RDKit Mol object from a molecular string.
 
+    Parsed molecules are cached, and every call returns a fresh copy of the cached molecule.
+
     Args:
         input_string (str): The molecular string.
         input_format (str): The format of the input string (e.g., 'smiles', 'smarts', 'molblock').
+        sanitize (bool): Whether to sanitize the molecule. Unsanitized molecules only get their
+            implicit valences and ring information computed, so aromaticity is not perceived.
+            SMARTS are never sanitized. Defaults to True.
 
     Returns:
         Chem.Mol: The RDKit Mol object.
@@ -30,18 +59,25 @@ def rdmol_from_string(input_string: str, input_format: str) -> Chem.Mol:
     Raises:
         ExceptionMolStringFormatInvalid: If the input format is not supported.
     """
-    converter_factory = {
-        "smiles": Chem.MolFromSmiles,
-        "smarts": Chem.MolFromSmarts,
-        "molblock": Chem.MolFromMolBlock,
-    }
-    if input_format not in converter_factory:
+    rdmol = _cached_rdmol_from_string(input_string, input_format, sanitize)
+    return Chem.Mol(rdmol) if rdmol is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _cached_rdmol_from_string(input_string: str, input_format: str, sanitize: bool = True) -> Chem.Mol:
+    convert_func = _MOL_CONVERTERS.get(input_format)
+    if convert_func is None:
         raise ExceptionMolStringFormatInvalid(
             f"The molecule input format {input_format} is not available: "
-            f"please use one of {list(converter_factory.keys())}"
+            f"please use one of {list(_MOL_CONVERTERS.keys())}"
         )
-    convert_func = converter_factory[input_format]
-    return convert_func(input_string)
+    if sanitize or input_format == "smarts":
+        return convert_func(input_string)
+    rdmol = convert_func(input_string, sanitize=False)
+    if rdmol is not None:
+        rdmol.UpdatePropertyCache(strict=False)
+        Chem.FastFindRings(rdmol)
+    return rdmol
 
 
 def rdrxn_from_string(
@@ -50,6 +86,8 @@ def rdrxn_from_string(
     """
     Build an RDKit Chemical Reaction object from a reaction string.
 
+    Parsed reactions are cached, and every call returns a fresh copy of the cached reaction.
+
     Args:
         input_string (str): The reaction string.
         input_format (str): The format of the input string (e.g., 'smiles', 'smarts', 'molblock').
@@ -60,17 +98,18 @@ def rdrxn_from_string(
     Raises:
         ExceptionRxnStringFormatInvalid: If the input format is not supported.
     """
-    converter_factory = {
-        "smiles": partial(Chem.rdChemReactions.ReactionFromSmarts, useSmiles=True),
-        "smarts": partial(Chem.rdChemReactions.ReactionFromSmarts, useSmiles=False),
-        "rxn_block": Chem.rdChemReactions.ReactionFromRxnBlock,
-    }
-    if input_format not in converter_factory:
+    rdrxn = _cached_rdrxn_from_string(input_string, input_format)
+    return rdChemReactions.ChemicalReaction(rdrxn) if rdrxn is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _cached_rdrxn_from_string(input_string: str, input_format: str) -> rdChemReactions.ChemicalReaction:
+    converter_func = _RXN_CONVERTERS.get(input_format)
+    if converter_func is None:
         raise ExceptionRxnStringFormatInvalid(
             f"The reaction input format {input_format} is not available: "
-            f"please use one of {list(converter_factory.keys())}"
+            f"please use one of {list(_RXN_CONVERTERS.keys())}"
         )
-    converter_func = converter_factory[input_format]
     return converter_func(input_string)
 
 
@@ -93,31 +132,17 @@ def rdrxn_to_string(
     Raises:
         ExceptionMolStringFormatInvalid: If the input format is not supported.
     """
+    converter_func = _RXN_WRITERS.get(out_fmt)
+    if converter_func is None:
+        raise ExceptionRdrxnStringFormatInvalid(
+            f"The reaction input format {out_fmt} is not available: "
+            f"please use one of {list(_RXN_WRITERS.keys())}"
+        )
     if not use_atom_mapping:
-        rdrxn_copy = copy.deepcopy(rdrxn)
+        rdrxn_copy = rdChemReactions.ChemicalReaction(rdrxn.ToBinary())
         Chem.rdChemReactions.RemoveMappingNumbersFromReactions(rdrxn_copy)
     else:
         rdrxn_copy = rdrxn
-
-    function_map = {
-        "smiles": partial(Chem.rdChemReactions.ReactionToSmiles, canonical=True),
-        "smarts": Chem.rdChemReactions.ReactionToSmarts,
-        "rxn": partial(
-            Chem.rdChemReactions.ReactionToRxnBlock,
-            forceV3000=True,
-            separateAgents=True,
-        ),
-        "rxn_blockV2K": Chem.rdChemReactions.ReactionToRxnBlock,
-        "rxn_blockV3K": partial(
-            Chem.rdChemReactions.ReactionToV3KRxnBlock, separateAgents=True
-        ),
-    }
-    if out_fmt not in function_map:
-        raise ExceptionRdrxnStringFormatInvalid(
-            f"The reaction input format {out_fmt} is not available: "
-            f"please use one of {list(function_map.keys())}"
-        )
-    converter_func = function_map[out_fmt]
     return converter_func(rdrxn_copy)
 
 
@@ -134,36 +159,54 @@ def hash_string(input_string: str) -> HashValue:
     Raises:
         TypeError: If the input is not a string.
         ValueError: If the input string is empty.
-        ExceptionHashing: If an error occurred during hashing.
     """
     if not isinstance(input_string, str):
         raise TypeError("Input reaction_string must be a string.")
     if not input_string.strip():
         raise ValueError("Input reaction_string cannot be empty.")
-    try:
-        smiles_bytes = input_string.encode('utf-8')
-        sha256 = hashlib.sha256()
-        sha256.update(smiles_bytes)
-        hash_value = sha256.hexdigest()
-        return hash_value
-    except Exception as e:
-        raise ExceptionHashing(f"An error occurred: {e}")
+    return hashlib.sha256(input_string.encode('utf-8')).hexdigest()
 
 
-def split_reaction_string(reaction_string: str) -> Dict[str, str]:
-    reactants, products = reaction_string.split(">>")
-    reactants_list = reactants.split(".")
-    products_list = products.split(".")
+def hash_strings(input_strings: Iterable[str]) -> List[HashValue]:
+    """
+    Calculate the SHA-256 hash values of many strings.
+
+    Equivalent to calling `hash_string` on each string, with the per-call lookups hoisted out of the loop.
+
+    Args:
+        input_strings (Iterable[str]): The strings.
+
+    Returns:
+        List[HashValue]: The SHA-256 hash values, in the same order as the strings.
+
+    Raises:
+        TypeError: If an input is not a string.
+        ValueError: If an input string is empty.
+    """
+    sha256 = hashlib.sha256
+    hash_values = []
+    append = hash_values.append
+    for input_string in input_strings:
+        if not isinstance(input_string, str):
+            raise TypeError("Input reaction_string must be a string.")
+        if not input_string.strip():
+            raise ValueError("Input reaction_string cannot be empty.")
+        append(sha256(input_string.encode('utf-8')).hexdigest())
+    return hash_values
+
+
+def split_reaction_string(reaction_string: str) -> Dict[str, List[str]]:
+    reactants, separator, products = reaction_string.partition(">>")
+    if not separator or ">>" in products:
+        raise ValueError(f"Reaction string must contain exactly one '>>': {reaction_string}")
     return {
-        'reactants': reactants_list,
-        'products': products_list
+        'reactants': reactants.split("."),
+        'products': products.split(".")
     }
 
 
 def join_molecule_strings(molecules: Dict[str, List[str]]) -> str:
-    reactants = ".".join(reactant for reactant in molecules['reactants'])
-    products = ".".join(product for product in molecules['products'])
-    return reactants + ">>" + products
+    return f"{'.'.join(molecules['reactants'])}>>{'.'.join(molecules['products'])}"
 
 
 def canonicalize_molecule_string(molecules_string: str) -> str:
@@ -171,13 +214,10 @@ def canonicalize_molecule_string(molecules_string: str) -> str:
     return Chem.MolToSmiles(rdkit_molecule)
 
 
+@lru_cache(maxsize=200_000)
 def canonicalize_reaction_string(reaction_string: str) -> str:
-    molecules = split_reaction_string(reaction_string)
-    canonicalized_reactants = [canonicalize_molecule_string(reactant) for reactant in molecules['reactants']]
-    canonicalized_products = [canonicalize_molecule_string(product) for product in molecules['products']]
-    canonicalized_molecules = {
-        'reactants': canonicalized_reactants,
-        'products': canonicalized_products
-    }
-    return join_molecule_strings(canonicalized_molecules)
-
+    reactants, products = reaction_string.split(">>")
+    return ">>".join(
+        ".".join(canonicalize_molecule_string(molecule) for molecule in side.split("."))
+        for side in (reactants, products)
+    )
@@ -3,6 +3,12 @@ from abc import ABC, abstractmethod
 from pymetatree.chemoinformatics.reaction_data_reader import ReadRxn, ReadSmarts
 from pymetatree.chemoinformatics.reaction_data_writer import WriteRxn, WritesSmarts
 
+# The readers and writers are stateless, so a single shared instance of each is enough.
+_RXN_READER = ReadRxn()
+_SMARTS_READER = ReadSmarts()
+_RXN_WRITER = WriteRxn()
+_SMARTS_WRITER = WritesSmarts()
+
 
 class ReactionDataConvertor(ABC):
     """Abstract base class for reaction data converters."""
@@ -32,10 +38,7 @@ class ConvertRxnToSmarts(ReactionDataConvertor):
         Returns:
             str: The converted reaction data in SMARTS format.
         """
-        rxn_reader = ReadRxn()
-        smarts_writer = WritesSmarts()
-        rxn = rxn_reader.read(reaction)
-        return smarts_writer.write(rxn)
+        return _SMARTS_WRITER.write(_RXN_READER.read(reaction))
 
 
 class ConvertSmartsToRxn(ReactionDataConvertor):
@@ -50,7 +53,4 @@ class ConvertSmartsToRxn(ReactionDataConvertor):
         Returns:
             str: The converted reaction data in RXN format.
         """
-        smart_reader = ReadSmarts()
-        rxn_writer = WriteRxn()
-        smarts = smart_reader.read(reaction)
-        return rxn_writer.write(smarts)
+        return _RXN_WRITER.write(_SMARTS_READER.read(reaction))
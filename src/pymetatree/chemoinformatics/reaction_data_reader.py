@@ -1,10 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
 
-from rdkit.Chem import AllChem, rdChemReactions
+from rdkit.Chem import rdChemReactions
 
 from pymetatree.chemoinformatics.reaction_data_error import ReactionDataError
 
+logger = logging.getLogger(__name__)
+
 
 class ReactionReader(ABC):
     """Abstract base class for reaction data readers."""
@@ -40,9 +42,9 @@ class ReadSmarts(ReactionReader):
         try:
             if not reaction:
                 raise ReactionDataError("Empty SMARTS string")
-            return AllChem.ReactionFromSmarts(reaction)
+            return rdChemReactions.ReactionFromSmarts(reaction)
         except Exception as e:
-            logging.error(f"Error while reading SMARTS data: {e}")
+            logger.error("Error while reading SMARTS data: %s", e)
             raise ReactionDataError(f"Error while reading SMARTS data: {e}")
 
 
@@ -64,7 +66,7 @@ class ReadRxn(ReactionReader):
         try:
             if not reaction:
                 raise ReactionDataError("Empty RXN string")
-            return AllChem.ReactionFromRxnFile(reaction)
+            return rdChemReactions.ReactionFromRxnFile(reaction)
         except Exception as e:
-            logging.error(f"Error while reading RXN data: {e}")
+            logger.error("Error while reading RXN data: %s", e)
             raise ReactionDataError(f"Error while reading RXN data: {e}")
@@ -1,10 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
 
-from rdkit.Chem import AllChem, rdChemReactions
+from rdkit.Chem import rdChemReactions
 
 from pymetatree.chemoinformatics.reaction_data_error import ReactionDataError
 
+logger = logging.getLogger(__name__)
+
 
 class ReactionWriter(ABC):
     """Abstract base class for reaction data writers."""
@@ -35,9 +37,9 @@ class WritesSmarts(ReactionWriter):
         try:
             if not reaction:
                 raise ReactionDataError("Empty reaction object")
-            return AllChem.ReactionToSmarts(reaction)
+            return rdChemReactions.ReactionToSmarts(reaction)
         except Exception as e:
-            logging.error(f"Error while writing SMARTS data: {e}")
+            logger.error("Error while writing SMARTS data: %s", e)
             raise ReactionDataError(f"Error while writing SMARTS data: {e}")
 
 
@@ -56,7 +58,7 @@ class WriteRxn(ReactionWriter):
         try:
             if not reaction:
                 raise ReactionDataError("Empty reaction object")
-            return AllChem.ReactionToRxnBlock(reaction)
+            return rdChemReactions.ReactionToRxnBlock(reaction)
         except Exception as e:
-            logging.error(f"Error while writing RXN data: {e}")
+            logger.error("Error while writing RXN data: %s", e)
             raise ReactionDataError(f"Error while writing RXN data: {e}")
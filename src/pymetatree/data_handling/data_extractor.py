@@ -8,8 +8,11 @@ The module also includes a context manager `handle_network_error` to handle netw
 occur during data extraction.
 """
 import os.path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from loguru import logger
+from pymetatree.logging_config import configure_once
 import abc
 from enviPath_python.enviPath import *
 from contextlib import contextmanager
@@ -23,7 +26,7 @@ from pymetatree.data_handling.db_connector import EAWAGDataConnector
 from pymetatree.data_handling.disk_manager import ElsevierDiskManager
 from typing import List, Dict
 
-logger.add("eawag_data_connector.log", rotation="1 MB", level="INFO")
+configure_once()
 
 # We use here hardcoded configuration for the EAWAG enviPath database. This will change in the future, so as to
 # use a proper configuration file and configuration manager.
@@ -47,6 +50,10 @@ EAWAG_DATABASE_CONFIG = {
     }
 }
 
+ELSEVIER_PARSER_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Files parsed ahead of the reactions being saved, which bounds the parsed data held in memory.
+ELSEVIER_PARSER_MAX_PENDING = 2 * ELSEVIER_PARSER_WORKERS
+
 
 @contextmanager
 def handle_network_error():
@@ -107,10 +114,10 @@ class EawagDataExtractor(DataExtractor):
         if limit is not None and (not isinstance(limit, int) or limit <= 0):
             raise LimitExceededError("Limit must be positive integer or None")
         with handle_network_error():
-            raw_reactions = self.connector.get_reactions()[:limit] if limit else self.connector.get_reactions()
+            raw_reactions = self.connector.get_reactions(limit)
+            reactions_json = self.connector.get_reactions_json(raw_reactions)
         reactions = []
-        for raw_reaction in raw_reactions:
-            reaction_json = raw_reaction.get_json()
+        for reaction_json in reactions_json:
             eawag_reaction = ChemicalReaction(**reaction_json)
             eawag_reaction.dataset = self.package_name
             reactions.append(eawag_reaction)
@@ -123,20 +130,34 @@ class ElsevierDataExtractor:
         self.disk_manager = ElsevierDiskManager()
 
     def extract_reactions(self) -> None:
-        json_file_paths = self.disk_manager.get_file_paths('.json')
-        for file_path in json_file_paths:
-            data = self.json_parser.parse_file(os.path.basename(file_path), os.path.dirname(file_path))
-            self.save_reactions(data)
+        # The paths are collected before any reaction is saved, as the reactions directory
+        # lives under the scanned base directory.
+        json_file_paths = list(self.disk_manager.get_file_paths('.json'))
+        with ThreadPoolExecutor(max_workers=ELSEVIER_PARSER_WORKERS) as executor:
+            pending = deque()
+            for file_path in json_file_paths:
+                if len(pending) == ELSEVIER_PARSER_MAX_PENDING:
+                    self.save_reactions(pending.popleft().result())
+                pending.append(executor.submit(self._parse_file, file_path))
+            while pending:
+                self.save_reactions(pending.popleft().result())
+
+    def _parse_file(self, file_path: str) -> Dict:
+        return self.json_parser.parse_file(os.path.basename(file_path), os.path.dirname(file_path))
 
     def save_reactions(self, data: Dict) -> None:
+        nodes = data['Nodes']
+        get_node = nodes.__getitem__
         for reaction_id, reaction_data in data['Edges'].items():
+            reactant_rn = reaction_data['Reactant RN']
+            product_rn = reaction_data['Product RN']
             reaction_info = {
                 'Reaction ID': reaction_id,
-                'Reactant RN': reaction_data['Reactant RN'],
-                'Product RN': reaction_data['Product RN'],
+                'Reactant RN': reactant_rn,
+                'Product RN': product_rn,
                 'Additional Products': reaction_data['Additional Products'],
-                'Reactant': data['Nodes'][reaction_data['Reactant RN']],
-                'Products': [data['Nodes'][rn] for rn in reaction_data['Product RN']]
+                'Reactant': get_node(reactant_rn),
+                'Products': list(map(get_node, product_rn))
             }
             reaction_file_path = self.disk_manager.get_reaction_file_path(reaction_id)
             self.json_parser.save_reaction(reaction_info, os.path.basename(reaction_file_path),
@@ -16,7 +16,10 @@ operations.
 
 import logging
 import abc
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import TypeAdapter
 
 from pymetatree.data_handling.models import ChemicalReaction
 from pymetatree.data_handling.data_extractor import EawagDataExtractor
@@ -35,6 +38,32 @@ from pymetatree.blueprint.blueprint_handler import BlueprintHandler
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 64
+
+
+def _map_reactions(func: Callable[[ChemicalReaction], Any], reactions: List[ChemicalReaction],
+                   n_jobs: Optional[int]) -> List[Any]:
+    """
+    Apply a function to every reaction, in worker processes when more than one job is requested.
+
+    Args:
+        func (Callable[[ChemicalReaction], Any]): A module-level function, so that it can be pickled.
+        reactions (List[ChemicalReaction]): The reactions to process.
+        n_jobs (Optional[int]): The number of worker processes. 1 runs in the current process,
+            None uses all available CPUs.
+
+    Returns:
+        List[Any]: The results, in the same order as the reactions.
+    """
+    if n_jobs == 1:
+        return [func(reaction) for reaction in reactions]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(func, reactions, chunksize=_CHUNK_SIZE))
+
+
+def _build_blueprint(reaction: ChemicalReaction) -> Dict:
+    return BlueprintHandler.generate(reaction).model_dump()
+
 
 class DataHandler(abc.ABC):
     """
@@ -72,24 +101,28 @@ class DataHandler(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def load_data(self, file_names: [str]) -> None:
+    def load_data(self, file_names: [str], trusted: bool = False) -> None:
         """
         Load the data from a file.
 
         Args:
             file_names (List[str]): A list of file names to load the data from.
+            trusted (bool): Whether the files were written by `save_data` and can skip validation.
         """
         pass
 
     @abc.abstractmethod
-    def extract_templates(self) -> None:
+    def extract_templates(self, n_jobs: Optional[int] = 1) -> None:
         """
        Extract templates from the downloaded data.
+
+       Args:
+           n_jobs (Optional[int]): The number of worker processes. None uses all available CPUs.
        """
         pass
 
     @abc.abstractmethod
-    def generate_blueprints(self) -> None:
+    def generate_blueprints(self, n_jobs: Optional[int] = 1) -> None:
         pass
 
     @abc.abstractmethod
@@ -134,6 +167,8 @@ class DataHandler(abc.ABC):
 
 
 class EawagDataHandler(DataHandler):
+    _REACTION_LIST_ADAPTER = TypeAdapter(List[ChemicalReaction])
+
     def __init__(self, data_storage_directory: str) -> None:
         """
         Initialize an EawagDataHandler instance.
@@ -180,17 +215,19 @@ class EawagDataHandler(DataHandler):
             DiskError: If an error occurs during data saving.
         """
         try:
-            data_as_dict = [reaction.model_dump() for reaction in self.eawag_data]
-            self.disk_manager.save_data_as_json(data_as_dict, file_name)
+            records = (reaction.model_dump() for reaction in self.eawag_data)
+            self.disk_manager.save_records_as_json(records, file_name, pretty=False)
         except Exception as e:
             raise DiskError(f"Error saving data: {e}") from e
 
-    def load_data(self, file_names: [str]) -> None:
+    def load_data(self, file_names: [str], trusted: bool = False) -> None:
         """
         Load Eawag data from a file.
 
         Args:
             file_names (List[str]): A list of file names to load the data from.
+            trusted (bool): Whether the files were written by `save_data`. Trusted records are loaded
+                without validation, so they must already hold valid SMILES. Defaults to False.
 
         Raises:
             DiskError: If an error occurs during data loading.
@@ -198,26 +235,43 @@ class EawagDataHandler(DataHandler):
         try:
             eawag_data = []
             for file_name in file_names:
-                loaded_data = self.disk_manager.load_json_data(file_name)
-                eawag_data.extend([ChemicalReaction(**reaction) for reaction in loaded_data])
+                records = self.disk_manager.iter_json_data(file_name)
+                if trusted:
+                    eawag_data.extend(map(ChemicalReaction.from_trusted_dict, records))
+                else:
+                    eawag_data.extend(self._REACTION_LIST_ADAPTER.validate_python(records))
             self.eawag_data = eawag_data
         except Exception as e:
             raise DiskError(f"Error loading data: {e}") from e
 
-    def extract_templates(self) -> None:
+    def extract_templates(self, n_jobs: Optional[int] = 1) -> None:
         """
         Extract templates from the downloaded Eawag data.
 
+        Args:
+            n_jobs (Optional[int]): The number of worker processes. Defaults to 1, which extracts the
+                templates in the current process; None uses all available CPUs.
+
         Raises:
             TemplateError: If an error occurs during template extraction.
         """
         try:
-            template_constructor = TemplateConstructor()
-            for i, reaction in enumerate(self.eawag_data):
-                self.eawag_data[i] = template_constructor.extract_from_chemical_reaction_object(reaction)
+            TemplateConstructor.extract_batch(self.eawag_data, n_jobs)
         except TemplateConstructionError as e:
             raise TemplateError(f"Error extracting templates: {e}") from e
 
+    def _create_mapping_manager(self) -> MappingManager:
+        """
+        Create a MappingManager over the current data.
+
+        A new manager is created for every mapping operation, so that changes made to `eawag_data`
+        in between are always taken into account.
+
+        Returns:
+            MappingManager: The mapping manager wrapping `eawag_data`.
+        """
+        return MappingManager(self.eawag_data, self.disk_manager)
+
     def get_list_to_map(self) -> List[Dict[str, str]]:
         """
         Get a list of dictionaries representing the unmapped reactions in the correct format
@@ -230,7 +284,7 @@ class EawagDataHandler(DataHandler):
             MappingError: If an error occurs during mapping list generation.
         """
         try:
-            mapping_manager = MappingManager(self.eawag_data)
+            mapping_manager = self._create_mapping_manager()
             return mapping_manager.generate_list_to_map()
         except Exception as e:
             raise MappingError(f"Error generating mapping list: {e}") from e
@@ -247,7 +301,7 @@ class EawagDataHandler(DataHandler):
             DiskError: If an error occurs during disk operations.
         """
         try:
-            mapping_manager = MappingManager(self.eawag_data)
+            mapping_manager = self._create_mapping_manager()
             mapping_manager.save_list_to_disk(file_name)
         except Exception as e:
             if isinstance(e, DiskError):
@@ -270,7 +324,7 @@ class EawagDataHandler(DataHandler):
             DiskError: If an error occurs during disk operations.
         """
         try:
-            mapping_manager = MappingManager(self.eawag_data)
+            mapping_manager = self._create_mapping_manager()
             mapping_manager.load_list_from_disk(file_name, file_format)
             mapping_manager.update_data(mapping_manager.mapped_list)
             self.eawag_data = mapping_manager.data
@@ -282,17 +336,11 @@ class EawagDataHandler(DataHandler):
             else:
                 print(f"An error occurred: {e}")
 
-    def generate_blueprints(self) -> None:
-        reactions = self.get_data()
-        blueprints = []
-        for reaction in reactions:
-            bp_handler = BlueprintHandler(reaction)
-            blueprints.append(bp_handler.blueprint.model_dump())
-        self.blueprints = blueprints
+    def generate_blueprints(self, n_jobs: Optional[int] = 1) -> None:
+        self.blueprints = _map_reactions(_build_blueprint, self.get_data(), n_jobs)
 
     def save_blueprints(self, file_name: str) -> None:
-        disk_manager = EAWAGDiskManager(self.data_storage_directory)
-        disk_manager.save_data_as_json(self.blueprints, file_name)
+        self.disk_manager.save_data_as_json(self.blueprints, file_name, pretty=True)
 
     def load_blueprints(self, file_name: [str]) -> None:
         pass
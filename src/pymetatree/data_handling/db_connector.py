@@ -4,16 +4,25 @@ retrieving chemical reactions. It uses the `enviPath` library to interact with t
 
 The `EAWAGDataConnector` class establishes a connection with the EAWAG data source using the provided
 package URL and host instance. It provides a method `get_reactions` to retrieve a list of chemical
-reactions from the specified package. The method includes retry logic using the `tenacity` library
-to handle network errors.
+reactions from the specified package, and a method `get_reactions_json` to download the details of
+those reactions concurrently over a pooled HTTP session. Both include retry logic using the `tenacity`
+library to handle network errors; the details are retried per reaction.
 
 The module also includes exception handling for various errors that may occur during the data
 retrieval process, such as network errors, invalid host instances, invalid package URLs, and
 resource not found errors.
 """
 
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
 import tenacity
 from loguru import logger
+from pymetatree.logging_config import configure_once
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
 from enviPath_python.enviPath import *
 from enviPath_python.objects import Reaction
 from pymetatree.data_handling.exceptions import (
@@ -23,7 +32,28 @@ from pymetatree.data_handling.exceptions import (
     ResourceNotFoundError
 )
 
-logger.add("eawag_data_connector.log", rotation="1 MB", level="INFO")
+configure_once()
+
+POOL_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def _get_envipath(host_instance: str) -> enviPath:
+    """
+    Get the enviPath client of a host, so that every connector to the host shares its session pool.
+    """
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=0)
+    return enviPath(host_instance, adapter=adapter)
+
+
+@lru_cache(maxsize=4096)
+def _fetch_reaction_json(host_instance: str, reaction_url: str) -> Dict:
+    """
+    Fetch the JSON details of a reaction, caching them by URL for the lifetime of the process.
+
+    The cached dictionary is shared, so callers must go through `EAWAGDataConnector` which hands out copies.
+    """
+    return _get_envipath(host_instance).requester.get_json(reaction_url)
 
 
 class EAWAGDataConnector:
@@ -47,7 +77,7 @@ class EAWAGDataConnector:
             raise InvalidPackageURLError("Package URL cannot be empty.")
         self.host_instance = host_instance
         self.package_url = package_url
-        self.eP = enviPath(self.host_instance)
+        self.eP = _get_envipath(self.host_instance)
         try:
             self.pkg = Package(self.eP.requester, id=self.package_url)
         except ValueError as e:
@@ -57,10 +87,16 @@ class EAWAGDataConnector:
     @tenacity.retry(stop=tenacity.stop_after_attempt(5),
                     wait=tenacity.wait_exponential(multiplier=1, max=60),
                     retry=tenacity.retry_if_exception_type(NetworkError))
-    def get_reactions(self) -> List[Reaction]:
+    def get_reactions(self, limit: Optional[int] = None) -> List[Reaction]:
         """
         Retrieve reactions from the specified package.
 
+        The package listing is a single request returning lazy Reaction objects; their details are
+        only downloaded by `get_reactions_json`, so a limit bounds the number of detail requests.
+
+        Args:
+            limit (Optional[int]): Maximum number of reactions to return. None returns all of them.
+
         Returns:
             List[Reaction]: A list of Reaction objects.
 
@@ -69,9 +105,42 @@ class EAWAGDataConnector:
             EAWAGDataConnectorError: If there is an error while retrieving reactions.
         """
         try:
-            return self.pkg.get_reactions()
+            return list(islice(self.pkg.get_reactions(), limit))
         except requests.exceptions.RequestException as e:
             logger.error(
                 f"Network error while retrieving reactions from package {self.package_url}: {e}"
             )
             raise NetworkError(f"Network error while retrieving reactions: {e}") from None
+
+    def get_reactions_json(self, reactions: List[Reaction], max_workers: int = POOL_SIZE) -> List[Dict]:
+        """
+        Retrieve the JSON details of reactions concurrently.
+
+        The requests share the keep-alive connection pool of the enviPath session, and each
+        reaction is retried on its own, so a failed request does not restart the whole download.
+        Details already fetched from the same host are served from an in-process cache keyed by
+        reaction URL, including when the reaction appears in several packages; every call returns its
+        own copies, so mutating them does not affect later retrievals.
+
+        Args:
+            reactions (List[Reaction]): The Reaction objects to retrieve, as returned by `get_reactions`.
+            max_workers (int, optional): The number of concurrent requests. Defaults to POOL_SIZE.
+
+        Returns:
+            List[Dict]: The JSON details of the reactions, in the same order as `reactions`.
+
+        Raises:
+            tenacity.RetryError: If a reaction still fails after all retries.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._get_reaction_json, reactions))
+
+    @tenacity.retry(stop=tenacity.stop_after_attempt(5),
+                    wait=tenacity.wait_exponential(multiplier=1, max=60),
+                    retry=tenacity.retry_if_exception_type(NetworkError))
+    def _get_reaction_json(self, reaction: Reaction) -> Dict:
+        try:
+            return copy.deepcopy(_fetch_reaction_json(self.host_instance, reaction.id))
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error while retrieving reaction {reaction.id}: {e}")
+            raise NetworkError(f"Network error while retrieving reaction: {e}") from None
@@ -11,11 +11,14 @@ JSON data).
 """
 
 import os
-import json
+import uuid
 from loguru import logger
-from typing import List, Dict
+from pymetatree.logging_config import configure_once
+from typing import Dict, Iterable, Iterator, List
 
-logger.add("eawag_data_connector.log", rotation="1 MB", level="INFO")
+from pymetatree.data_handling import json_backend
+
+configure_once()
 
 
 class EAWAGDiskManager:
@@ -26,42 +29,86 @@ class EAWAGDiskManager:
         data_storage_directory (str): The directory path where data will be stored.
 
     Methods:
-        save_data_as_json(data: List[Dict], file_name: str) -> None:
+        save_data_as_json(data: List[Dict], file_name: str, *, pretty: bool = False) -> None:
             Saves the provided data as a JSON file on disk.
+        save_records_as_json(records: Iterable[Dict], file_name: str, *, pretty: bool = False) -> None:
+            Saves records as a JSON file on disk, serializing them one at a time.
         load_json_data(file_name: str) -> List[Dict]:
             Loads and returns data from a JSON file on disk.
+        iter_json_data(file_name: str) -> Iterator[Dict]:
+            Yields the records of a JSON file on disk one at a time.
     """
     def __init__(self, data_storage_directory: str) -> None:
         self.data_storage_directory = data_storage_directory
-        if not os.path.exists(self.data_storage_directory):
-            try:
-                os.makedirs(self.data_storage_directory)
-            except OSError as e:
-                logger.error(f"Error creating data storage directory: {e}")
-                raise e
-
-    def save_data_as_json(self, data: List[Dict], file_name: str) -> None:
+        try:
+            os.makedirs(self.data_storage_directory, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Error creating data storage directory: {e}")
+            raise e
+
+    def save_data_as_json(self, data: List[Dict], file_name: str, *, pretty: bool = False) -> None:
         """
         Saves the provided data as a JSON file on disk.
 
         Args:
             data (List[Dict]): The data to be saved as a JSON file.
             file_name (str): The name of the file to be saved.
+            pretty (bool): Whether to indent the JSON for human readers. Defaults to False, which
+                writes compact JSON.
 
         Raises:
             OSError: If there is an error creating or writing to the file.
-            TypeError: If the provided data is not a list of dictionaries.
+            TypeError: If the provided data is not a list or is not JSON serializable.
         """
-        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        if not isinstance(data, list):
             raise TypeError("Input data must be a list of dictionaries.")
+        content = json_backend.dumps(data, pretty)
         file_path = os.path.join(self.data_storage_directory, file_name)
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            with open(file_path, 'wb') as f:
+                f.write(content)
         except OSError as e:
             logger.error(f"Error while saving reaction data: {e}")
             raise e
 
+    def save_records_as_json(self, records: Iterable[Dict], file_name: str, *, pretty: bool = False) -> None:
+        """
+        Saves records as a JSON file on disk, serializing them one at a time.
+
+        Unlike `save_data_as_json`, the records do not need to be collected in a list first,
+        so they can be produced lazily while the file is written. The records are written to a
+        temporary file next to the target, which only replaces the target once every record has been
+        written, so a failure never leaves a truncated file behind.
+
+        Args:
+            records (Iterable[Dict]): The records to be saved as a JSON array.
+            file_name (str): The name of the file to be saved.
+            pretty (bool): Whether to indent the JSON for human readers. Defaults to False, which
+                writes compact JSON.
+
+        Raises:
+            OSError: If there is an error creating or writing to the file.
+            TypeError: If a record is not a dictionary.
+        """
+        file_path = os.path.join(self.data_storage_directory, file_name)
+        temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, 'xb') as f:
+                json_backend.dump_items(map(self._check_record, records), f, pretty)
+            os.replace(temp_path, file_path)
+        except BaseException as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if isinstance(e, OSError):
+                logger.error(f"Error while saving reaction data: {e}")
+            raise e
+
+    @staticmethod
+    def _check_record(record: Dict) -> Dict:
+        if not isinstance(record, dict):
+            raise TypeError("Input data must be a list of dictionaries.")
+        return record
+
     def load_json_data(self, file_name: str) -> List[Dict]:
         """
         Loads and returns data from a JSON file on disk.
@@ -78,8 +125,8 @@ class EAWAGDiskManager:
         """
         file_path = os.path.join(self.data_storage_directory, file_name)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_backend.loads(f.read())
         except OSError as e:
             logger.error(f"Error while loading reaction data: {e}")
             raise e
@@ -88,6 +135,33 @@ class EAWAGDiskManager:
             raise e
         return data
 
+    def iter_json_data(self, file_name: str) -> Iterator[Dict]:
+        """
+        Yields the records of a JSON file on disk one at a time.
+
+        The file is streamed when `ijson` is installed, so only the current record is held in memory.
+
+        Args:
+            file_name (str): The name of the file to be loaded.
+
+        Yields:
+            Dict: The records of the JSON file.
+
+        Raises:
+            OSError: If there is an error reading the file.
+            ValueError: If the file contents are not valid JSON.
+        """
+        file_path = os.path.join(self.data_storage_directory, file_name)
+        try:
+            with open(file_path, 'rb') as f:
+                yield from json_backend.iter_items(f)
+        except OSError as e:
+            logger.error(f"Error while loading reaction data: {e}")
+            raise e
+        except ValueError as e:
+            logger.error(f"Invalid JSON file: {e}")
+            raise e
+
 
 # Not functional yet:
 class ElsevierDiskManager:
@@ -96,14 +170,15 @@ class ElsevierDiskManager:
         self.reactions_dir = os.path.join(settings.disk_storage.elsevier_directory, "reactions")
         os.makedirs(self.reactions_dir, exist_ok=True)
 
-    def get_file_paths(self, extension: str) -> List:
-        file_paths = []
-        for root, dirs, files in os.walk(self.base_directory):
-            for file in files:
-                if file.endswith(extension):
-                    file_path = os.path.join(root, file)
-                    file_paths.append(file_path)
-        return file_paths
+    def get_file_paths(self, extension: str) -> Iterator[str]:
+        directories = [self.base_directory]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.name.endswith(extension) and entry.is_file():
+                        yield entry.path
 
     def get_reaction_file_path(self, reaction_id: str) -> str:
         return os.path.join(self.reactions_dir, f"{reaction_id}.json")
@@ -0,0 +1,110 @@
+"""
+This module provides the JSON encoding and decoding used to read and write reaction data on disk.
+
+It uses `orjson` when it is installed and falls back to the standard library `json` module otherwise.
+Both backends produce the same compact UTF-8 encoded JSON. Human-readable documents are indented with
+four spaces, the layout the package has always written; they are produced by the standard library,
+as `orjson` only supports two-space indentation.
+
+Top-level JSON arrays can also be read item by item with `iter_items`, which streams the file with
+`ijson` when it is installed, and written item by item with `dump_items`. Both optional backends are
+installed with the `fast` extra of the package.
+"""
+import json
+from typing import Any, BinaryIO, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to a UTF-8 encoded JSON document.
+
+    Args:
+        data (Any): The data to serialize.
+        pretty (bool): Whether to indent the document with four spaces. Defaults to False.
+
+    Returns:
+        bytes: The JSON document.
+
+    Raises:
+        TypeError: If the data is not JSON serializable.
+    """
+    if pretty:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        content (Union[bytes, str]): The JSON document.
+
+    Returns:
+        Any: The deserialized data.
+
+    Raises:
+        ValueError: If the content is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def iter_items(file: BinaryIO) -> Iterator[Any]:
+    """
+    Iterate over the items of a JSON array stored in a binary file.
+
+    With `ijson` installed the file is parsed incrementally and only one item is held in memory
+    at a time; otherwise the whole document is loaded first.
+
+    Args:
+        file (BinaryIO): The file containing a JSON array, opened in binary mode.
+
+    Yields:
+        Any: The deserialized items of the array.
+
+    Raises:
+        ValueError: If the content is not valid JSON.
+    """
+    if ijson is not None:
+        try:
+            yield from ijson.items(file, 'item', use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON document: {e}") from e
+    else:
+        yield from loads(file.read())
+
+
+def dump_items(items: Iterable[Any], file: BinaryIO, pretty: bool = False) -> None:
+    """
+    Write items to a binary file as a JSON array, serializing one item at a time.
+
+    Args:
+        items (Iterable[Any]): The items of the array.
+        file (BinaryIO): The file to write to, opened in binary mode.
+        pretty (bool): Whether to indent the array with four spaces, as `dumps` does. Defaults to False.
+
+    Raises:
+        TypeError: If an item is not JSON serializable.
+    """
+    opening, separator, closing = (b'[\n    ', b',\n    ', b'\n]') if pretty else (b'[', b',', b']')
+    written = False
+    for item in items:
+        file.write(separator if written else opening)
+        content = dumps(item, pretty)
+        file.write(content.replace(b'\n', b'\n    ') if pretty else content)
+        written = True
+    file.write(closing if written else b'[]')
@@ -1,12 +1,15 @@
-import json
 import os
 import logging
 import string
 from typing import Dict
 import abc
 
+from pymetatree.data_handling import json_backend
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+_NON_PRINTABLE = bytes(b for b in range(256) if chr(b) not in string.printable)
+
 
 class JSONParser(abc.ABC):
     def parse_data(self, file_name: str) -> Dict:
@@ -20,15 +23,12 @@ class ElsevierJSONParser:
     @staticmethod
     def parse_file(file_name: str, directory: str) -> Dict:
         file_path = os.path.join(directory, file_name)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            printable = set(string.printable)
-            filtered_content = ''.join(filter(lambda x: x in printable, content))
-            data = json.loads(filtered_content)
-        return data
+        with open(file_path, 'rb') as f:
+            filtered_content = f.read().translate(None, delete=_NON_PRINTABLE)
+        return json_backend.loads(filtered_content)
 
     @staticmethod
     def save_reaction(reaction_info: Dict, file_name: str, directory: str) -> None:
         file_path = os.path.join(directory, file_name)
-        with open(file_path, 'w') as file:
-            json.dump(reaction_info, file, indent=4)
\ No newline at end of file
+        with open(file_path, 'wb') as file:
+            file.write(json_backend.dumps(reaction_info, pretty=True))
\ No newline at end of file
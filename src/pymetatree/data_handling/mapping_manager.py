@@ -12,10 +12,16 @@ The module also includes exception handling for file not found errors that may o
 operations.
 """
 
-from typing import List, Dict
+import os
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional
 from pymetatree.data_handling.models import ChemicalReaction
 from pymetatree.data_handling.disk_manager import EAWAGDiskManager
 
+SMI_READ_BUFFER_SIZE = 1 << 20
+SMI_LINE_PATTERN = re.compile(r'(\S+)[ \t]+(\S+)')
+
 
 class MappingManager:
     """
@@ -26,15 +32,20 @@ class MappingManager:
         disk_manager (DiskManager): An instance of the DiskManager class.
         mapped_list (List[Dict[str, str]]): A list of mapped reactions.
     """
-    def __init__(self, data: List[ChemicalReaction]) -> None:
+    def __init__(self, data: List[ChemicalReaction], disk_manager: Optional[EAWAGDiskManager] = None,
+                 n_jobs: Optional[int] = 1) -> None:
         """
         Initialize a MappingManager instance.
 
         Args:
             data (List[ChemicalReaction]): A list of ChemicalReaction objects.
+            disk_manager (Optional[EAWAGDiskManager]): The disk manager used to save and load mapping lists.
+            n_jobs (Optional[int]): The number of worker processes used to canonicalize reactions that
+                have not been canonicalized yet. None uses all available CPUs. Defaults to 1.
         """
         self.data = data
-        self.disk_manager = EAWAGDiskManager()
+        self.n_jobs = n_jobs
+        self.disk_manager = disk_manager if disk_manager is not None else EAWAGDiskManager()
         self.mapped_list = None
 
     def generate_list_to_map(self) -> List[Dict[str, str]]:
@@ -44,26 +55,39 @@ class MappingManager:
         Returns:
             List[Dict[str, str]]: A list of dictionaries containing unmapped reactions.
         """
-        list_to_map = []
+        return list(self.iter_list_to_map())
+
+    def iter_list_to_map(self) -> Iterator[Dict[str, str]]:
+        """
+        Yield the dictionaries of unmapped reactions one at a time.
+
+        When more than one job is configured, the reactions are canonicalized in a batch first;
+        otherwise each reaction is canonicalized as its entry is produced.
+
+        Yields:
+            Dict[str, str]: A dictionary containing an unmapped reaction.
+        """
+        if self.n_jobs != 1:
+            ChemicalReaction.canonicalize_all(self.data, self.n_jobs)
         for reaction in self.data:
-            list_entry = {
-                "input_string": reaction.unmapped_smiles_canonicalized,
-                "query_id": reaction.uid
-            }
-            list_to_map.append(list_entry)
-        return list_to_map
-
-    def update_data(self, mapped_data: List[Dict[str, str]]) -> None:
+            yield {"input_string": reaction.unmapped_smiles_canonicalized, "query_id": reaction.uid}
+
+    def update_data(self, mapped_data: Iterable[Dict[str, str]]) -> None:
         """
         Update the original data with the mapped reactions.
 
+        The reactions are indexed by uid once per call, so changes made to `data` since the
+        manager was created are taken into account.
+
         Args:
-            mapped_data (List[Dict[str, str]]): A list of dictionaries containing mapped reactions.
+            mapped_data (Iterable[Dict[str, str]]): Dictionaries containing mapped reactions, consumed in a single pass.
         """
+        reactions_by_uid: Dict[str, List[ChemicalReaction]] = defaultdict(list)
+        for reaction in self.data:
+            reactions_by_uid[reaction.uid].append(reaction)
         for mapped_reaction in mapped_data:
-            for unmapped_reaction in self.data:
-                if mapped_reaction["query_id"] == unmapped_reaction.uid:
-                    unmapped_reaction.mapped_smiles = mapped_reaction["output_string"]
+            for unmapped_reaction in reactions_by_uid.get(mapped_reaction["query_id"], ()):
+                unmapped_reaction.mapped_smiles = mapped_reaction["output_string"]
 
     def save_list_to_disk(self, file_name: str) -> None:
         """
@@ -72,23 +96,13 @@ class MappingManager:
         Args:
             file_name (str): The name of the file to save the data to.
         """
-        data = self.generate_list_to_map()
-        self.disk_manager.save_data_as_json(data, file_name)
+        self.disk_manager.save_records_as_json(self.iter_list_to_map(), file_name)
 
     @staticmethod
-    def read_mapped_smi(file_name: str):
-        with open(file_name, 'r') as f:
-            lines = f.readlines()
-        data = []
-        for line in lines:
-            line = line.strip()
-            if line:
-                parts = line.split(' ')
-                if len(parts) == 2:
-                    smiles, uid = parts
-                    data.append({'query_id': uid, 'output_string': smiles})
-        return data
-
+    def read_mapped_smi(file_name: str) -> List[Dict[str, str]]:
+        with open(file_name, 'r', buffering=SMI_READ_BUFFER_SIZE) as f:
+            matches = (SMI_LINE_PATTERN.fullmatch(line.strip()) for line in f)
+            return [{'query_id': match.group(2), 'output_string': match.group(1)} for match in matches if match]
 
     def load_list_from_disk(self, file_name: str, file_format: str) -> None:
         """
@@ -107,5 +121,7 @@ class MappingManager:
             except FileNotFoundError:
                 raise FileNotFoundError(f"File '{file_name}' not found.")
         elif file_format == "smi":
+            if not os.path.isfile(file_name):
+                raise FileNotFoundError(f"File '{file_name}' not found.")
             self.mapped_list = self.read_mapped_smi(file_name)
 
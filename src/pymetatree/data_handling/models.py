@@ -12,12 +12,57 @@ The `Pathway` model represents a pathway, with a field for its UID.
 """
 
 import logging
-from pydantic import BaseModel, Field, model_validator, computed_field, AliasChoices, field_validator
-from typing import List, Optional
-from pymetatree.chemoinformatics.functions import hash_string, canonicalize_reaction_string, rdmol_from_string
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    ValidationInfo,
+    model_validator,
+    computed_field,
+    AliasChoices,
+    field_validator,
+)
+from typing import List, Optional, Tuple, Type
+from pymetatree.chemoinformatics.functions import (
+    hash_string,
+    hash_strings,
+    canonicalize_reaction_string,
+    rdmol_from_string,
+)
 from pymetatree.template.models import Template
 
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _field_values(model: Type[BaseModel], data: dict) -> dict:
+    """
+    Key the values of a dictionary by model field name, accepting the field validation aliases.
+
+    Keys that are not fields of the model, such as computed fields, are dropped.
+    """
+    values = {}
+    for name, field in model.model_fields.items():
+        alias = field.validation_alias
+        if isinstance(alias, AliasChoices):
+            keys = [name, *(choice for choice in alias.choices if isinstance(choice, str))]
+        else:
+            keys = [name, alias] if isinstance(alias, str) else [name]
+        for key in keys:
+            if key in data:
+                values[name] = data[key]
+                break
+    return values
+
+
+def _canonicalize_unmapped_smiles(unmapped_smiles: str) -> str:
+    try:
+        return canonicalize_reaction_string(unmapped_smiles)
+    except Exception as e:
+        logger.error("Error canonicalizing reaction string: %s", e)
+        return ""
 
 
 class Molecule(BaseModel):
@@ -31,7 +76,14 @@ class Molecule(BaseModel):
 
     @field_validator('smiles')
     @classmethod
-    def check_smiles_validity(cls, value: str) -> str:
+    def check_smiles_validity(cls, value: str, info: ValidationInfo) -> str:
+        """
+        Check that the SMILES string can be parsed by RDKit.
+
+        The check is skipped when validating with `context={'trusted': True}`, for data written by this library.
+        """
+        if info.context and info.context.get('trusted'):
+            return value
         try:
             molecule = rdmol_from_string(value, 'smiles')
             if molecule is None:
@@ -90,29 +142,85 @@ class ChemicalReaction(BaseModel):
     uid: Optional[str] = Field(None, description="Unique identifier for the reaction")
     unmapped_smiles: str = Field(validation_alias=AliasChoices('smirks', 'unmapped_smiles'),
                                  description="SMILES string of the reaction")
+    _canonical_smiles: Optional[Tuple[str, str]] = PrivateAttr(None)
 
     @computed_field
     @property
     def unmapped_smiles_canonicalized(self) -> str:
         """
         Compute the canonicalized version of the unmapped SMILES string.
+
+        The result is cached together with the SMILES string it was computed from, so it is
+        only recomputed after `unmapped_smiles` changes.
         """
-        try:
-            return canonicalize_reaction_string(self.unmapped_smiles)
-        except Exception as e:
-            logging.error(f"Error canonicalizing reaction string: {e}")
-            return ""
+        if not self._has_canonical_smiles():
+            self._canonical_smiles = (self.unmapped_smiles, _canonicalize_unmapped_smiles(self.unmapped_smiles))
+        return self._canonical_smiles[1]
+
+    def _has_canonical_smiles(self) -> bool:
+        return self._canonical_smiles is not None and self._canonical_smiles[0] == self.unmapped_smiles
+
+    @classmethod
+    def canonicalize_all(cls, reactions: List['ChemicalReaction'], n_jobs: Optional[int] = 1) -> None:
+        """
+        Compute the canonicalized unmapped SMILES of many reactions in one batch.
+
+        Reactions whose canonical SMILES is already cached are skipped. The others are canonicalized
+        in worker processes when more than one job is requested, and the results are cached on each
+        reaction for `unmapped_smiles_canonicalized` to return.
+
+        Args:
+            reactions (List[ChemicalReaction]): The reactions to canonicalize.
+            n_jobs (Optional[int]): The number of worker processes. 1 runs in the current process,
+                None uses all available CPUs. Defaults to 1.
+        """
+        pending = [reaction for reaction in reactions if not reaction._has_canonical_smiles()]
+        unmapped_smiles = [reaction.unmapped_smiles for reaction in pending]
+        if n_jobs == 1 or len(pending) < 2:
+            canonical_smiles = list(map(_canonicalize_unmapped_smiles, unmapped_smiles))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                canonical_smiles = list(executor.map(_canonicalize_unmapped_smiles, unmapped_smiles, chunksize=256))
+        for reaction, smiles, canonical in zip(pending, unmapped_smiles, canonical_smiles):
+            reaction._canonical_smiles = (smiles, canonical)
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> 'ChemicalReaction':
+        """
+        Build a ChemicalReaction, with its nested models, from a dictionary without validating it.
+
+        Intended for data written by this library, such as the output of `model_dump`. Fields may be
+        keyed by name or by validation alias. A stored `unmapped_smiles_canonicalized` seeds the
+        canonical SMILES cache, and only missing UIDs are computed.
+
+        Args:
+            data (dict): The reaction fields, keyed by field name or alias.
+
+        Returns:
+            ChemicalReaction: The reaction.
+        """
+        fields = _field_values(cls, data)
+        for key, model in (("reactants", Molecule), ("products", Molecule),
+                           ("enzyme_classes", EnzymeClass), ("pathways", Pathway)):
+            if fields.get(key) is not None:
+                fields[key] = [model.model_construct(**_field_values(model, item)) for item in fields[key]]
+        if fields.get("template") is not None:
+            fields["template"] = Template.model_construct(**_field_values(Template, fields["template"]))
+        reaction = cls.model_construct(**fields)
+        canonical_smiles = data.get("unmapped_smiles_canonicalized")
+        if canonical_smiles is not None:
+            reaction._canonical_smiles = (reaction.unmapped_smiles, canonical_smiles)
+        return reaction.set_uid()
 
     @model_validator(mode='after')
-    def set_uid(self) -> None:
+    def set_uid(self) -> 'ChemicalReaction':
         """
         Set UIDs for the reaction, reactants, and products if not provided.
         """
         if self.uid is None:
             self.uid = hash_string(self.unmapped_smiles_canonicalized)
-        for reactant in self.reactants:
-            if reactant.uid is None:
-                reactant.uid = hash_string(reactant.smiles)
-        for product in self.products:
-            if product.uid is None:
-                product.uid = hash_string(product.smiles)
+        molecules = chain(self.reactants or (), self.products or ())
+        missing = [molecule for molecule in molecules if molecule.uid is None]
+        for molecule, uid in zip(missing, hash_strings(molecule.smiles for molecule in missing)):
+            molecule.uid = uid
+        return self
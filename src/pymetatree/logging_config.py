@@ -0,0 +1,37 @@
+"""
+This module configures the loguru file sink shared by the data handling modules.
+
+Modules that log through loguru call `configure_once` at import time; the log file sink is only
+registered on the first call, so every record is formatted and written a single time. The file is
+only created once the first record is logged. Applications that do not want the log file call
+`remove_file_sink`.
+"""
+from loguru import logger
+
+LOG_FILE = "eawag_data_connector.log"
+
+_SINK_ID = None
+
+
+def configure_once(log_file: str = LOG_FILE) -> None:
+    """
+    Register the log file sink, unless it has already been registered.
+
+    Args:
+        log_file (str): The path of the log file. Defaults to `LOG_FILE`, in the current working directory.
+    """
+    global _SINK_ID
+    if _SINK_ID is not None:
+        return
+    _SINK_ID = logger.add(log_file, rotation="1 MB", level="INFO", delay=True)
+
+
+def remove_file_sink() -> None:
+    """
+    Remove the log file sink registered by `configure_once`, if any.
+    """
+    global _SINK_ID
+    if _SINK_ID is None:
+        return
+    logger.remove(_SINK_ID)
+    _SINK_ID = None
@@ -0,0 +1,33 @@
+"""
+This module provides a cache for values derived from the fields of pydantic models.
+
+Like `functools.cached_property`, the value is kept in the instance `__dict__` outside of the model
+fields, so it is ignored by equality and serialization. Unlike it, the value is stored together with
+the source it was computed from and recomputed when that source changes, so it stays correct after
+field assignment or `model_copy(update=...)`.
+"""
+from typing import Callable, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+def cached_on_key(model: BaseModel, name: str, key: Hashable, compute: Callable[[], T]) -> T:
+    """
+    Return the value cached on a model for a key, computing it when the key has changed.
+
+    Args:
+        model (BaseModel): The model holding the cache.
+        name (str): The name of the cache entry; it must not be a field name.
+        key (Hashable): The source of the value, usually the field values it is computed from.
+        compute (Callable[[], T]): Computes the value for the current key.
+
+    Returns:
+        T: The cached value.
+    """
+    cached = model.__dict__.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, compute())
+        model.__dict__[name] = cached
+    return cached[1]
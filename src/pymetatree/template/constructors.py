@@ -1,7 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
 from pymetatree.template.models import Template, RDChiralTemplateExtractorInput
-from pymetatree.template.extractor import extract_rdchiral_template
+from pymetatree.template.extractor import extract_rdchiral_template_raw
 from pymetatree.data_handling.models import ChemicalReaction
 
+_CHUNK_SIZE = 64
+
+
+def _extract_template_fields(reaction_string: str) -> Dict[str, Optional[str]]:
+    return TemplateConstructor.extract_from_string(reaction_string).model_dump(exclude={"uid"})
+
 
 class TemplateConstructor:
     def __init__(self) -> None:
@@ -9,14 +17,20 @@ class TemplateConstructor:
 
     @staticmethod
     def extract_from_string(reaction_string: str) -> Template:
-        template = Template(reaction_string=reaction_string)
-        rdchiral_input = RDChiralTemplateExtractorInput.from_smiles(template.reaction_string)
-        rdchiral_output = extract_rdchiral_template(rdchiral_input)
-        rdchiral_output_dict = rdchiral_output.to_dict()
-        template.products_template = rdchiral_output_dict["products"]
-        template.reactants_template = rdchiral_output_dict["reactants"]
-        template.template_rwd_smarts = rdchiral_output_dict["reaction_smarts"]
-        template.template_fwd_smarts = ">".join(template.template_rwd_smarts.split(">")[::-1])
+        rdchiral_input = RDChiralTemplateExtractorInput.from_smiles(reaction_string)
+        rdchiral_output = extract_rdchiral_template_raw(rdchiral_input)
+        template_rwd_smarts = rdchiral_output.get("reaction_smarts", "")
+        template_fwd_smarts = ""
+        if template_rwd_smarts:
+            reactants, agents, products = template_rwd_smarts.split(">", 2)
+            template_fwd_smarts = f"{products}>{agents}>{reactants}"
+        template = Template(
+            reaction_string=reaction_string,
+            products_template=rdchiral_output.get("products", ""),
+            reactants_template=rdchiral_output.get("reactants", ""),
+            template_fwd_smarts=template_fwd_smarts,
+            template_rwd_smarts=template_rwd_smarts,
+        )
         return template
 
     @staticmethod
@@ -24,3 +38,40 @@ class TemplateConstructor:
         template = TemplateConstructor.extract_from_string(chemical_reaction.mapped_smiles)
         chemical_reaction.template = template
         return chemical_reaction
+
+    @staticmethod
+    def extract_batch(
+        chemical_reactions: List[ChemicalReaction], n_jobs: Optional[int] = 1
+    ) -> List[ChemicalReaction]:
+        """
+        Extract and set the templates of many reactions, in worker processes when more
+        than one job is requested.
+
+        Only the mapped SMILES are sent to the workers; the templates are validated from the
+        returned fields in the current process, so both paths return the same Template objects.
+
+        Args:
+            chemical_reactions (List[ChemicalReaction]): The reactions to extract the templates from.
+            n_jobs (Optional[int]): The number of worker processes. Defaults to 1, which extracts the
+                templates in the current process; None uses all available CPUs.
+
+        Returns:
+            List[ChemicalReaction]: The same reactions, with their templates set.
+        """
+        reaction_strings = [chemical_reaction.mapped_smiles for chemical_reaction in chemical_reactions]
+        if n_jobs == 1:
+            templates = [
+                TemplateConstructor.extract_from_string(reaction_string)
+                for reaction_string in reaction_strings
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                templates = [
+                    Template.model_validate(fields)
+                    for fields in executor.map(
+                        _extract_template_fields, reaction_strings, chunksize=_CHUNK_SIZE
+                    )
+                ]
+        for chemical_reaction, template in zip(chemical_reactions, templates):
+            chemical_reaction.template = template
+        return chemical_reactions
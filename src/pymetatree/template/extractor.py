@@ -1,15 +1,34 @@
+from functools import lru_cache
+from typing import Dict
+
 from pymetatree.template.models import RDChiralTemplateExtractorOutput, RDChiralTemplateExtractorInput
 from pymetatree.template.exceptions import RDChiralExtractionError
 from rdchiral import template_extractor
 
 
+@lru_cache(maxsize=4096)
+def _cached_extract_from_reaction(_id: str, products: str, agents: str, reactants: str) -> Dict:
+    return template_extractor.extract_from_reaction(
+        reaction={"_id": _id, "products": products, "agents": agents, "reactants": reactants}
+    )
+
+
+def extract_rdchiral_template_raw(
+    rdchiral_input: RDChiralTemplateExtractorInput,
+) -> Dict:
+    try:
+        return dict(_cached_extract_from_reaction(
+            rdchiral_input._id, rdchiral_input.products, rdchiral_input.agents, rdchiral_input.reactants
+        ))
+    except Exception as e:
+        raise RDChiralExtractionError(f"Error while extracting templates: {e}")
+
+
 def extract_rdchiral_template(
     rdchiral_input: RDChiralTemplateExtractorInput,
 ) -> RDChiralTemplateExtractorOutput:
+    rdchiral_output_dictionary = extract_rdchiral_template_raw(rdchiral_input)
     try:
-        rdchiral_output_dictionary = template_extractor.extract_from_reaction(
-            reaction=rdchiral_input.to_dict()
-        )
         rdchiral_output = RDChiralTemplateExtractorOutput(**rdchiral_output_dictionary)
         return rdchiral_output
     except Exception as e:
@@ -1,8 +1,10 @@
 from typing import Optional
 from pydantic import BaseModel, Field, model_validator, computed_field
 from dataclasses import dataclass, field
+from rdkit.Chem import rdChemReactions
 
-from pymetatree.chemoinformatics.functions import hash_string
+from pymetatree.chemoinformatics.functions import hash_string, rdrxn_from_string
+from pymetatree.model_cache import cached_on_key
 from pymetatree.template.exceptions import RDChiralInputError
 
 
@@ -73,4 +75,18 @@ class Template(BaseModel):
     @computed_field
     @property
     def uid(self) -> str:
-        return hash_string(self.reaction_string)
+        return cached_on_key(self, "_uid_cache", self.reaction_string, lambda: hash_string(self.reaction_string))
+
+    @property
+    def rxn_fwd(self) -> rdChemReactions.ChemicalReaction:
+        return cached_on_key(
+            self, "_rxn_fwd_cache", self.template_fwd_smarts,
+            lambda: rdrxn_from_string(self.template_fwd_smarts, "smarts")
+        )
+
+    @property
+    def rxn_rwd(self) -> rdChemReactions.ChemicalReaction:
+        return cached_on_key(
+            self, "_rxn_rwd_cache", self.template_rwd_smarts,
+            lambda: rdrxn_from_string(self.template_rwd_smarts, "smarts")
+        )
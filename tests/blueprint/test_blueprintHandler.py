@@ -123,10 +123,48 @@ def test_run_reaction():
     assert Chem.MolToSmiles(result) == Chem.MolToSmiles(expected_product)
     with pytest.raises(ValueError):
         handler.run_reaction(0, "forward", [])
+    with pytest.raises(ValueError):
+        handler.run_reaction(0, "forward", [Chem.MolFromSmiles(reactant_smiles)])
     with pytest.raises(RuntimeError):
         handler.run_reaction(0, "forward", ["invalid_smiles"])
 
 
 def test_activate_molecule():
     molecule = BlueprintHandler.activate_molecule(reactant_smiles)
-    assert isinstance(molecule, Chem.Mol)
\ No newline at end of file
+    assert isinstance(molecule, Chem.Mol)
+
+
+def test_activate_template_reuses_parsed_reaction():
+    handler = create_blueprint_handler(chemical_reaction)
+    handler.activate_template(0, "forward")
+    forward_rdrxn = handler._rdrxn
+    handler.activate_template(0, "backward")
+    assert handler._rdrxn is not forward_rdrxn
+    handler.activate_template(0, "forward")
+    assert handler._rdrxn is forward_rdrxn
+
+
+def test_build_blueprint_without_template():
+    reaction_without_template = chemical_reaction.model_copy(update={"template": None})
+    with pytest.raises(ValueError):
+        BlueprintHandler(reaction_without_template)
+
+
+def test_compile():
+    handler = create_blueprint_handler(chemical_reaction)
+    run = handler.compile(0, "forward")
+    expected_product = rdmol_from_string(product_smiles, 'smiles')
+    assert Chem.MolToSmiles(run([reactant_smiles])) == Chem.MolToSmiles(expected_product)
+    with pytest.raises(ValueError):
+        run([])
+    with pytest.raises(ValueError):
+        run([Chem.MolFromSmiles(reactant_smiles)])
+    with pytest.raises(RuntimeError):
+        run(["invalid_smiles"])
+    with pytest.raises(IndexError):
+        handler.compile(5, "forward")
+
+
+def test_generate():
+    blueprint = BlueprintHandler.generate(chemical_reaction)
+    assert blueprint.uid == create_blueprint_handler(chemical_reaction).blueprint.uid
@@ -111,3 +111,15 @@ class TestBlueprint:
         blueprint2 = Blueprint(components=components, templates=[template2])
 
         assert blueprint1.uid != blueprint2.uid
+
+    def test_uid_follows_templates(self, sample_blueprint, sample_template):
+        template2 = Template(reaction_string="CCC>>CC")
+        uid = sample_blueprint.uid
+        sample_blueprint.templates.append(template2)
+        appended_uid = sample_blueprint.uid
+        assert appended_uid != uid
+        assert sample_blueprint.model_dump()["uid"] == appended_uid
+        sample_blueprint.templates = [template2, sample_template]
+        assert sample_blueprint.uid == appended_uid
+        template2.reaction_string = "CCCC>>CC"
+        assert sample_blueprint.uid != appended_uid
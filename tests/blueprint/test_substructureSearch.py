@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from rdkit import Chem
 from pymetatree.chemoinformatics.functions import rdmol_from_string
@@ -92,7 +94,7 @@ blueprint_dataset = [
 ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def blueprint_search():
     return BlueprintSubstructureSearch(blueprint_dataset)
 
@@ -115,4 +117,44 @@ def test_search_valid_smiles(blueprint_search):
 def test_search_invalid_smiles(blueprint_search):
     with pytest.raises(SubstructureSearchError) as excinfo:
         blueprint_search.search(invalid_smiles)
-    assert "Invalid SMILES string" in str(excinfo.value)
\ No newline at end of file
+    assert "Invalid SMILES string" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_invalid_blueprint_smiles(n_jobs):
+    broken_blueprint = copy.deepcopy(blueprint_dataset[1])
+    broken_blueprint['components']['products'][0]['chemical_classes']['smarts'] = invalid_smiles
+    with pytest.raises(SubstructureSearchError) as excinfo:
+        BlueprintSubstructureSearch([blueprint_dataset[0], broken_blueprint], n_jobs=n_jobs)
+    assert f"blueprint2: {invalid_smiles}" in str(excinfo.value)
+
+
+def test_shared_smiles_are_parsed_once(blueprint_search):
+    assert len(blueprint_search._library) == 3
+    assert blueprint_search._blueprint_rows == {'blueprint1': [0, 1], 'blueprint2': [0, 2]}
+
+
+def test_search_with_threads():
+    blueprint_search = BlueprintSubstructureSearch(blueprint_dataset, n_jobs=2)
+    assert blueprint_search._blueprint_rows == {'blueprint1': [0, 1], 'blueprint2': [0, 2]}
+    query_smiles = 'CC(C)(C)C(C(N1C=NC=N1)OC2=CC=C(C=C2)C3=CC=CC=C3)O'
+    assert blueprint_search.search(query_smiles) == ['blueprint1', 'blueprint2']
+
+
+def test_search_ignores_query_chirality(blueprint_search):
+    assert blueprint_search.search('CC(C)(C)[C@H](O)C') == ['blueprint1', 'blueprint2']
+
+
+def test_search_no_match(blueprint_search):
+    assert blueprint_search.search('ClCCCl') == []
+
+
+def test_search_empty_dataset():
+    assert BlueprintSubstructureSearch([]).search(valid_smiles) == []
+
+
+def test_search_without_sanitization():
+    blueprint_search = BlueprintSubstructureSearch(blueprint_dataset, sanitize=False)
+    query_smiles = 'CC(C)(C)C(C(N1C=NC=N1)OC2=CC=C(C=C2)C3=CC=CC=C3)O'
+    assert blueprint_search.search(query_smiles) == ['blueprint1', 'blueprint2']
+    assert blueprint_search.search('ClCCCl') == []
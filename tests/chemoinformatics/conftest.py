@@ -0,0 +1,7 @@
+import pytest
+from rdkit.Chem import rdChemReactions
+
+
+@pytest.fixture(scope="session")
+def amide_rxn():
+    return rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
@@ -11,20 +11,20 @@ from pymetatree.chemoinformatics.functions import (
     rdrxn_from_string,
     rdmol_from_string,
     rdrxn_to_string,
-    hash_string
+    hash_string,
+    hash_strings,
+    canonicalize_reaction_string,
+    split_reaction_string,
+    join_molecule_strings
 )
 
 
-def test_rdrxn_from_string_smiles_format():
-    input_string = "C.C>>CC"
-    result = rdrxn_from_string(input_string, input_format="smiles")
-    assert result is not None
-
-
-def test_rdrxn_from_string_smarts_format():
-    input_string = "[CH3:1][CH2:2][OH:3]>>[CH3:1][CH2:2][O:3][CH3]"
-    result = rdrxn_from_string(input_string, input_format="smarts")
-    assert result is not None
+@pytest.mark.parametrize("input_string, fmt", [
+    ("C.C>>CC", "smiles"),
+    ("[CH3:1][CH2:2][OH:3]>>[CH3:1][CH2:2][O:3][CH3]", "smarts"),
+])
+def test_rdrxn_from_string_formats(input_string, fmt):
+    assert rdrxn_from_string(input_string, input_format=fmt) is not None
 
 
 def test_rdrxn_from_string_invalid_format():
@@ -51,45 +51,18 @@ def test_rdmol_from_string_invalid_format():
         rdmol_from_string(input_string, input_format="invalid_format")
 
 
-def test_rdrxn_to_string_smiles_format():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
-    result = rdrxn_to_string(reaction, out_fmt="smiles")
-    assert result is not None
-
-
-def test_rdrxn_to_string_smarts_format():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
-    result = rdrxn_to_string(reaction, out_fmt="smarts")
-    assert result is not None
-
-
-def test_rdrxn_to_string_rxn_format():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
-    result = rdrxn_to_string(reaction, out_fmt="rxn")
-    assert result is not None
-
-
-def test_rdrxn_to_string_rxn_blockV2K_format():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
-    result = rdrxn_to_string(reaction, out_fmt="rxn_blockV2K")
-    assert result is not None
-
-
-def test_rdrxn_to_string_rxn_blockV3K_format():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
-    result = rdrxn_to_string(reaction, out_fmt="rxn_blockV2K")
-    assert result is not None
+@pytest.mark.parametrize("fmt", ["smiles", "smarts", "rxn", "rxn_blockV2K", "rxn_blockV3K"])
+def test_rdrxn_to_string_formats(amide_rxn, fmt):
+    assert rdrxn_to_string(amide_rxn, out_fmt=fmt) is not None
 
 
-def test_rdrxn_to_string_invalid_forma():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
+def test_rdrxn_to_string_invalid_forma(amide_rxn):
     with pytest.raises(ExceptionRdrxnStringFormatInvalid):
-        rdrxn_to_string(reaction, out_fmt="invalid_format")
+        rdrxn_to_string(amide_rxn, out_fmt="invalid_format")
 
 
-def test_rdrxn_to_string_use_atom_mapping():
-    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
-    result = rdrxn_to_string(reaction, out_fmt="smiles", use_atom_mapping=True)
+def test_rdrxn_to_string_use_atom_mapping(amide_rxn):
+    result = rdrxn_to_string(amide_rxn, out_fmt="smiles", use_atom_mapping=True)
     assert result is not None
 
 
@@ -109,3 +82,60 @@ def test_hash_smiles_none_input():
         hash_string(reaction_string)
 
 
+def test_hash_strings():
+    strings = ["CCO", "CC=O", "CCO"]
+    assert hash_strings(strings) == [hash_string(string) for string in strings]
+    with pytest.raises(ValueError):
+        hash_strings(["CCO", ""])
+
+
+def test_rdrxn_to_string_does_not_modify_input():
+    reaction = rdChemReactions.ReactionFromSmarts('[C:1](=[O:2])-[OD1].[N!H0:3]>>[C:1](=[O:2])[N:3]')
+    original_smarts = rdChemReactions.ReactionToSmarts(reaction)
+    rdrxn_to_string(reaction, out_fmt="smarts")
+    assert rdChemReactions.ReactionToSmarts(reaction) == original_smarts
+
+
+def test_rdmol_from_string_returns_independent_copies():
+    first = rdmol_from_string("C1NCN1", input_format="smiles")
+    second = rdmol_from_string("C1NCN1", input_format="smiles")
+    assert first is not second
+
+
+def test_canonicalize_reaction_string_keeps_molecule_order():
+    reaction_string = "CN.CC(O)=O>>O.CNC(C)=O"
+    assert canonicalize_reaction_string(reaction_string) == "CN.CC(=O)O>>O.CNC(C)=O"
+
+
+def test_canonicalize_reaction_string_perceives_aromaticity():
+    reaction_string = "CC(C)(C)C(C(N1C=NC=N1)OC2=CC=C(C=C2)C3=CC=CC=C3)O>>C1=NC=NN1"
+    assert canonicalize_reaction_string(reaction_string) == \
+        "CC(C)(C)C(O)C(Oc1ccc(-c2ccccc2)cc1)n1cncn1>>c1nc[nH]n1"
+
+
+def test_split_and_join_reaction_string_round_trip():
+    reaction_string = "CC(=O)O.CN>>CC(=O)NC.O"
+    molecules = split_reaction_string(reaction_string)
+    assert molecules == {'reactants': ['CC(=O)O', 'CN'], 'products': ['CC(=O)NC', 'O']}
+    assert join_molecule_strings(molecules) == reaction_string
+
+
+def test_split_reaction_string_invalid():
+    with pytest.raises(ValueError):
+        split_reaction_string("CC(=O)O.CN")
+    with pytest.raises(ValueError):
+        split_reaction_string("C>>C>>C")
+
+
+def test_canonicalize_reaction_string_is_cached():
+    canonicalize_reaction_string.cache_clear()
+    canonicalize_reaction_string("OCC>>O=CC")
+    canonicalize_reaction_string("OCC>>O=CC")
+    assert canonicalize_reaction_string.cache_info().hits == 1
+
+
+def test_rdmol_from_string_without_sanitization():
+    rdmol = rdmol_from_string("C1=CC=CC=C1", "smiles", sanitize=False)
+    assert not rdmol.GetAtomWithIdx(0).GetIsAromatic()
+    assert rdmol.GetRingInfo().NumRings() == 1
+    assert rdmol_from_string("C1=CC=CC=C1", "smiles").GetAtomWithIdx(0).GetIsAromatic()
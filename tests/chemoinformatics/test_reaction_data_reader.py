@@ -3,10 +3,9 @@ Module: test_reaction_data_reader.py
 This module contains test cases for the reaction data reader classes.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from rdkit.Chem import rdChemReactions
 
 from pymetatree.chemoinformatics.reaction_data_reader import (
     ReactionDataError,
@@ -20,7 +19,7 @@ class TestReadSmarts:
     Test cases for the ReadSmarts class.
     """
 
-    @patch("rdkit.Chem.AllChem.ReactionFromSmarts")
+    @patch("rdkit.Chem.rdChemReactions.ReactionFromSmarts")
     def test_read_valid_smarts(self, mock_reaction_from_smarts):
         """
         Test the read method with valid SMARTS data.
@@ -32,11 +31,11 @@ class TestReadSmarts:
         - None
         """
         smarts_data = "[C:1]>>[C:1](Cl)"
-        mock_reaction = MagicMock(spec=rdChemReactions.ChemicalReaction)
+        mock_reaction = object()
         mock_reaction_from_smarts.return_value = mock_reaction
         reader = ReadSmarts()
         result = reader.read(smarts_data)
-        assert result == mock_reaction
+        assert result is mock_reaction
 
     def test_read_empty_smarts(self):
         """
@@ -59,7 +58,7 @@ class TestReadRxn:
     Test cases for the ReadRxn class.
     """
 
-    @patch("rdkit.Chem.AllChem.ReactionFromRxnFile")
+    @patch("rdkit.Chem.rdChemReactions.ReactionFromRxnFile")
     def test_read_valid_rxn(self, mock_reaction_from_rxn):
         """
         Test the read method with valid reaction data.
@@ -71,11 +70,11 @@ class TestReadRxn:
         - None
         """
         rxn_data = "A>>B"
-        mock_reaction = MagicMock(spec=rdChemReactions.ChemicalReaction)
+        mock_reaction = object()
         mock_reaction_from_rxn.return_value = mock_reaction
         reader = ReadRxn()
         result = reader.read(rxn_data)
-        assert result == mock_reaction
+        assert result is mock_reaction
 
     def test_read_empty_rxn(self):
         """
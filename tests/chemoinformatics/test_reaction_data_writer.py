@@ -4,8 +4,6 @@ This module contains test cases for the reaction data writer classes.
 """
 
 import pytest
-from rdkit.Chem import rdChemReactions
-
 from pymetatree.chemoinformatics.reaction_data_writer import (
     ReactionDataError,
     WriteRxn,
@@ -16,33 +14,31 @@ from pymetatree.chemoinformatics.reaction_data_writer import (
 class TestReactionWriters:
     """Test cases for the reaction data writer classes."""
 
-    def test_writes_smarts(self):
+    def test_writes_smarts(self, amide_rxn):
         """Test the write method for WritesSmarts with a valid reaction object.
 
         Args:
-            None
+            amide_rxn: The shared amide coupling reaction fixture.
 
         Returns:
             None
         """
-        reaction = rdChemReactions.ReactionFromSmarts("[C:1]>>[C:1](Cl)")
         writer = WritesSmarts()
-        result = writer.write(reaction)
+        result = writer.write(amide_rxn)
         assert isinstance(result, str)
         assert result != ""
 
-    def test_writes_rxn(self):
+    def test_writes_rxn(self, amide_rxn):
         """Test the write method for WriteRxn with a valid reaction object.
 
         Args:
-            None
+            amide_rxn: The shared amide coupling reaction fixture.
 
         Returns:
             None
         """
-        reaction = rdChemReactions.ReactionFromSmarts("[C:1]>>[C:1](Cl)")
         writer = WriteRxn()
-        result = writer.write(reaction)
+        result = writer.write(amide_rxn)
         assert isinstance(result, str)
         assert result != ""
 
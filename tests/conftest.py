@@ -2,6 +2,14 @@ from pathlib import Path
 
 import pytest
 
+from pymetatree import logging_config
+
+
+@pytest.fixture(autouse=True, scope="session")
+def no_log_file():
+    """Keep the tests from writing the package log file into the working directory."""
+    logging_config.remove_file_sink()
+
 
 @pytest.fixture
 def data_folder_path():
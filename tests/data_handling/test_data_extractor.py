@@ -1,6 +1,9 @@
+import os
+from types import SimpleNamespace
+
 import pytest
 import requests
-from unittest.mock import patch
+from pymetatree.data_handling import data_extractor
 from pymetatree.data_handling.data_extractor import handle_network_error
 from pymetatree.data_handling.exceptions import NetworkError
 
@@ -11,9 +14,29 @@ def test_handle_network_error_no_exception():
 
 
 def test_handle_network_error_with_exception():
-    with patch('requests.exceptions.RequestException',
-               side_effect=requests.exceptions.RequestException('Network error')):
-        with pytest.raises(NetworkError):
-            with handle_network_error():
-                raise requests.exceptions.RequestException('Network error')
-            
\ No newline at end of file
+    with pytest.raises(NetworkError):
+        with handle_network_error():
+            raise requests.exceptions.RequestException('Network error')
+
+
+def test_elsevier_extract_reactions_bounds_pending_files(monkeypatch):
+    monkeypatch.setattr(data_extractor, "ELSEVIER_PARSER_MAX_PENDING", 3)
+    file_paths = [f"/data/{i}.json" for i in range(20)]
+    parsed, saved = [], []
+
+    class FakeParser:
+        def parse_file(self, file_name, directory):
+            parsed.append(file_name)
+            return {"file_name": file_name}
+
+    extractor = object.__new__(data_extractor.ElsevierDataExtractor)
+    extractor.json_parser = FakeParser()
+    extractor.disk_manager = SimpleNamespace(get_file_paths=lambda extension: iter(file_paths))
+
+    def save_reactions(data):
+        assert len(parsed) - len(saved) <= 3
+        saved.append(data["file_name"])
+
+    extractor.save_reactions = save_reactions
+    extractor.extract_reactions()
+    assert saved == [os.path.basename(path) for path in file_paths]
@@ -0,0 +1,66 @@
+import pytest
+from pymetatree.data_handling.data_handler import EawagDataHandler
+from pymetatree.data_handling.exceptions import DiskError
+from pymetatree.data_handling.models import ChemicalReaction
+from pymetatree.template.models import Template
+
+
+@pytest.fixture
+def reactions():
+    return [
+        ChemicalReaction(smirks="CCO>>CC=O", educts=[{"smiles": "CCO"}], products=[{"smiles": "CC=O"}]),
+        ChemicalReaction(smirks="CC=O>>CC(=O)O", educts=[{"smiles": "CC=O"}], products=[{"smiles": "CC(=O)O"}]),
+    ]
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return EawagDataHandler(str(tmp_path / "data"))
+
+
+def test_append_mapped_list_after_in_place_changes(handler, reactions, tmp_path):
+    handler.eawag_data = reactions[:1]
+    assert len(handler.get_list_to_map()) == 1
+    handler.eawag_data.append(reactions[1])
+    assert len(handler.get_list_to_map()) == 2
+    smi_file = tmp_path / "mapped.smi"
+    smi_file.write_text(f"[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O {reactions[1].uid}\n")
+    handler.append_mapped_list(str(smi_file), "smi")
+    assert reactions[1].mapped_smiles == "[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O"
+
+
+def test_save_and_load_trusted_data_round_trip(handler, reactions):
+    reactions[0].template = Template(reaction_string="[CH3:1][OH:2]>>[CH2:1]=[O:2]",
+                                     template_fwd_smarts="[C:1][O:2]>>[C:1]=[O:2]",
+                                     template_rwd_smarts="[C:1]=[O:2]>>[C:1][O:2]")
+    handler.eawag_data = reactions
+    handler.save_data("reactions.json")
+    handler.load_data(["reactions.json"], trusted=True)
+    assert [reaction.model_dump() for reaction in handler.eawag_data] == [
+        reaction.model_dump() for reaction in reactions
+    ]
+    assert all(reaction._has_canonical_smiles() for reaction in handler.eawag_data)
+    assert isinstance(handler.eawag_data[0].template, Template)
+
+
+def test_load_data_trusted_matches_untrusted(handler, reactions):
+    handler.eawag_data = reactions
+    handler.save_data("first.json")
+    handler.eawag_data = list(reversed(reactions))
+    handler.save_data("second.json")
+    handler.load_data(["first.json", "second.json"])
+    untrusted = handler.eawag_data
+    handler.load_data(["first.json", "second.json"], trusted=True)
+    trusted = handler.eawag_data
+    assert len(trusted) == 4
+    assert [reaction.unmapped_smiles_canonicalized for reaction in trusted] == [
+        reaction.unmapped_smiles_canonicalized for reaction in untrusted
+    ]
+    assert trusted == untrusted
+    assert [reaction.uid for reaction in trusted] == [reaction.uid for reaction in untrusted]
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_data_missing_file(handler, trusted):
+    with pytest.raises(DiskError):
+        handler.load_data(["missing.json"], trusted=trusted)
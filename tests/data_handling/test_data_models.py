@@ -0,0 +1,69 @@
+import pytest
+from pydantic import ValidationError
+from pymetatree.data_handling import models
+from pymetatree.data_handling.models import ChemicalReaction, Molecule
+
+
+def test_molecule_invalid_smiles():
+    with pytest.raises(ValidationError):
+        Molecule(smiles="invalid_smiles")
+
+
+def test_molecule_trusted_context_skips_smiles_check():
+    molecule = Molecule.model_validate({"smiles": "invalid_smiles"}, context={"trusted": True})
+    assert molecule.smiles == "invalid_smiles"
+
+
+def test_trusted_context_reaches_nested_molecules():
+    reaction = ChemicalReaction.model_validate(
+        {"smirks": "CCO>>CC=O", "educts": [{"smiles": "CCO"}], "products": [{"smiles": "CC=O"}]},
+        context={"trusted": True},
+    )
+    assert reaction.reactants[0].uid is not None
+
+
+def test_from_trusted_dict_round_trip():
+    reaction = ChemicalReaction(smirks="CCO>>CC=O", educts=[{"smiles": "CCO"}], products=[{"smiles": "CC=O"}])
+    restored = ChemicalReaction.from_trusted_dict(reaction.model_dump())
+    assert isinstance(restored.reactants[0], Molecule)
+    assert restored.model_dump() == reaction.model_dump()
+
+
+def test_from_trusted_dict_sets_missing_uid():
+    reaction = ChemicalReaction(smirks="CCO>>CC=O", educts=[{"smiles": "CCO"}], products=[{"smiles": "CC=O"}])
+    record = reaction.model_dump()
+    record["uid"] = None
+    assert ChemicalReaction.from_trusted_dict(record).uid == reaction.uid
+
+
+def test_from_trusted_dict_resolves_aliases():
+    record = {"smirks": "CCO>>CC=O", "educts": [{"compoundName": "ethanol", "smiles": "CCO"}],
+              "products": [{"smiles": "CC=O"}], "ecNumbers": [{"ecNumber": "1.1.1.1"}]}
+    reaction = ChemicalReaction.from_trusted_dict(record)
+    assert reaction.unmapped_smiles == "CCO>>CC=O"
+    assert isinstance(reaction.reactants[0], Molecule)
+    assert reaction.reactants[0].name == "ethanol"
+    assert reaction.enzyme_classes[0].enzyme_class_number == "1.1.1.1"
+    assert reaction.model_dump() == ChemicalReaction.model_validate(record).model_dump()
+
+
+def test_from_trusted_dict_seeds_canonical_smiles():
+    reaction = ChemicalReaction(smirks="OCC>>O=CC", educts=[{"smiles": "OCC"}], products=[{"smiles": "O=CC"}])
+    record = reaction.model_dump()
+    record["unmapped_smiles_canonicalized"] = "stored"
+    assert ChemicalReaction.from_trusted_dict(record).unmapped_smiles_canonicalized == "stored"
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_canonicalize_all(n_jobs, monkeypatch):
+    reactions = [
+        ChemicalReaction.model_construct(unmapped_smiles="OCC>>O=CC"),
+        ChemicalReaction.model_construct(unmapped_smiles="O=CC>>OC(=O)C"),
+    ]
+    ChemicalReaction.canonicalize_all(reactions, n_jobs=n_jobs)
+
+    def not_cached(smiles):
+        raise AssertionError(f"{smiles} was not canonicalized by canonicalize_all")
+
+    monkeypatch.setattr(models, "_canonicalize_unmapped_smiles", not_cached)
+    assert [reaction.unmapped_smiles_canonicalized for reaction in reactions] == ["CCO>>CC=O", "CC=O>>CC(=O)O"]
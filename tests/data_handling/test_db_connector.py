@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+import tenacity
+from pymetatree.data_handling import db_connector
+from pymetatree.data_handling.db_connector import EAWAGDataConnector
+
+HOST = "https://envipath.example"
+
+
+class FakeRequester:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+
+    def get_json(self, url):
+        self.calls.append(url)
+        if self.failures:
+            self.failures -= 1
+            raise requests.exceptions.ConnectionError("connection reset")
+        return {"id": url, "smirks": "CCO>>CC=O", "educts": [{"smiles": "CCO"}]}
+
+
+class FakePackage:
+    def __init__(self, requester, id):
+        self.id = id
+
+    def get_reactions(self):
+        return iter(SimpleNamespace(id=f"{self.id}/reaction/{i}") for i in range(5))
+
+
+@pytest.fixture
+def requester(monkeypatch):
+    requester = FakeRequester()
+    monkeypatch.setattr(db_connector, "_get_envipath", lambda host: SimpleNamespace(requester=requester))
+    monkeypatch.setattr(db_connector, "Package", FakePackage)
+    monkeypatch.setattr(EAWAGDataConnector._get_reaction_json.retry, "wait", tenacity.wait_none())
+    db_connector._fetch_reaction_json.cache_clear()
+    yield requester
+    db_connector._fetch_reaction_json.cache_clear()
+
+
+@pytest.fixture
+def connector(requester):
+    return EAWAGDataConnector(f"{HOST}/package/1", HOST)
+
+
+@pytest.mark.parametrize("limit, expected", [(None, 5), (2, 2), (0, 0)])
+def test_get_reactions_limit(connector, limit, expected):
+    assert len(connector.get_reactions(limit)) == expected
+
+
+def test_get_reactions_json_is_cached(connector, requester):
+    reactions = connector.get_reactions(3)
+    first = connector.get_reactions_json(reactions, max_workers=2)
+    second = connector.get_reactions_json(reactions, max_workers=2)
+    assert [r["id"] for r in first] == [r.id for r in reactions]
+    assert first == second
+    assert len(requester.calls) == 3
+
+
+def test_get_reactions_json_returns_copies(connector):
+    reactions = connector.get_reactions(1)
+    first = connector.get_reactions_json(reactions)
+    first[0]["educts"].append({"smiles": "O"})
+    first[0]["smirks"] = "C>>C"
+    second = connector.get_reactions_json(reactions)
+    assert second[0]["smirks"] == "CCO>>CC=O"
+    assert second[0]["educts"] == [{"smiles": "CCO"}]
+
+
+def test_get_reactions_json_retries(connector, requester):
+    requester.failures = 2
+    reactions = connector.get_reactions(1)
+    assert connector.get_reactions_json(reactions, max_workers=2)[0]["id"] == reactions[0].id
+    assert len(requester.calls) == 3
+
+
+def test_get_reactions_json_gives_up(connector, requester):
+    requester.failures = 10
+    with pytest.raises(tenacity.RetryError):
+        connector.get_reactions_json(connector.get_reactions(1))
+    assert len(requester.calls) == 5
@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+from pymetatree.data_handling.disk_manager import EAWAGDiskManager, ElsevierDiskManager
+
+RECORDS = [{"smirks": "CCO>>CC=O", "id": 1}, {"smirks": "CC=O>>CC(=O)O", "id": 2}]
+
+
+@pytest.fixture
+def disk_manager(tmp_path):
+    return EAWAGDiskManager(str(tmp_path))
+
+
+def test_save_records_and_iter_json_data(disk_manager):
+    disk_manager.save_records_as_json(iter(RECORDS), "records.json")
+    records = disk_manager.iter_json_data("records.json")
+    assert next(records) == RECORDS[0]
+    assert list(records) == RECORDS[1:]
+    assert disk_manager.load_json_data("records.json") == RECORDS
+    assert os.listdir(disk_manager.data_storage_directory) == ["records.json"]
+
+
+def test_save_records_failure_keeps_existing_file(disk_manager):
+    disk_manager.save_records_as_json(RECORDS, "records.json")
+
+    def failing_records():
+        yield RECORDS[0]
+        raise RuntimeError("producer failed")
+
+    with pytest.raises(RuntimeError):
+        disk_manager.save_records_as_json(failing_records(), "records.json")
+    with pytest.raises(TypeError):
+        disk_manager.save_records_as_json([RECORDS[0], "not a record"], "records.json")
+    assert disk_manager.load_json_data("records.json") == RECORDS
+    assert os.listdir(disk_manager.data_storage_directory) == ["records.json"]
+
+
+def test_iter_json_data_errors(disk_manager):
+    with pytest.raises(OSError):
+        list(disk_manager.iter_json_data("missing.json"))
+    with open(os.path.join(disk_manager.data_storage_directory, "broken.json"), "wb") as f:
+        f.write(b'[{"id": 1}, {')
+    with pytest.raises(ValueError):
+        list(disk_manager.iter_json_data("broken.json"))
+
+
+def test_get_file_paths(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "linked.json").mkdir()
+    for path in ("top.json", "notes.txt", "a/first.json", "a/b/second.json", "linked.json/hidden.json"):
+        (tmp_path / path).write_text("[]")
+    (tmp_path / "a" / "dir_link.json").symlink_to(tmp_path / "linked.json", target_is_directory=True)
+    (tmp_path / "a" / "file_link.json").symlink_to(tmp_path / "top.json")
+    disk_manager = object.__new__(ElsevierDiskManager)
+    disk_manager.base_directory = str(tmp_path / "a")
+    paths = disk_manager.get_file_paths(".json")
+    assert not isinstance(paths, list)
+    assert sorted(os.path.relpath(path, tmp_path) for path in paths) == [
+        os.path.join("a", "b", "second.json"),
+        os.path.join("a", "file_link.json"),
+        os.path.join("a", "first.json"),
+    ]
+
+
+@pytest.mark.parametrize("save", ["save_data_as_json", "save_records_as_json"])
+def test_save_pretty(disk_manager, save):
+    getattr(disk_manager, save)(RECORDS, "compact.json")
+    getattr(disk_manager, save)(RECORDS, "pretty.json", pretty=True)
+    with open(os.path.join(disk_manager.data_storage_directory, "compact.json"), "rb") as f:
+        assert f.read() == json.dumps(RECORDS, separators=(",", ":")).encode("utf-8")
+    with open(os.path.join(disk_manager.data_storage_directory, "pretty.json"), "rb") as f:
+        assert f.read() == json.dumps(RECORDS, indent=4).encode("utf-8")
+    assert disk_manager.load_json_data("pretty.json") == disk_manager.load_json_data("compact.json")
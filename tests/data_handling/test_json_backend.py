@@ -0,0 +1,62 @@
+import io
+import importlib.util
+import json
+
+import pytest
+from pymetatree.data_handling import json_backend
+
+DATA = [
+    {"smirks": "CCO>>CC=O", "educts": [{"smiles": "CCO"}], "score": 0.5, "name": "éthanol"},
+    {"smirks": "CC=O>>CC(=O)O", "educts": [], "score": None, "name": ""},
+]
+
+
+def _backends():
+    for name in ("orjson", "ijson"):
+        yield pytest.param(
+            name,
+            marks=pytest.mark.skipif(importlib.util.find_spec(name) is None, reason=f"{name} is not installed"),
+        )
+    yield pytest.param(None, id="stdlib")
+
+
+@pytest.fixture(params=_backends())
+def backend(request, monkeypatch):
+    """Keep only the named optional backend, so that the others fall back to the standard library."""
+    for name in ("orjson", "ijson"):
+        if name != request.param:
+            monkeypatch.setattr(json_backend, name, None)
+    return request.param
+
+
+def test_dumps_and_loads(backend):
+    assert json_backend.loads(json_backend.dumps(DATA)) == DATA
+    assert json_backend.loads(json_backend.dumps(DATA).decode("utf-8")) == DATA
+
+
+def test_dumps_pretty(backend):
+    assert json_backend.dumps({"a": [1]}) == b'{"a":[1]}'
+    assert json_backend.dumps({"a": [1]}, pretty=True) == b'{\n    "a": [\n        1\n    ]\n}'
+    assert json_backend.dumps("é") == '"é"'.encode("utf-8")
+
+
+def test_loads_invalid(backend):
+    with pytest.raises(ValueError):
+        json_backend.loads(b'{"a":')
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+@pytest.mark.parametrize("items", [DATA, []])
+def test_dump_and_iter_items(backend, items, pretty):
+    file = io.BytesIO()
+    json_backend.dump_items(iter(items), file, pretty=pretty)
+    assert json_backend.loads(file.getvalue()) == items
+    if pretty:
+        assert file.getvalue() == json.dumps(items, indent=4, ensure_ascii=False).encode("utf-8")
+    file.seek(0)
+    assert list(json_backend.iter_items(file)) == items
+
+
+def test_iter_items_invalid(backend):
+    with pytest.raises(ValueError):
+        list(json_backend.iter_items(io.BytesIO(b'[{"a": 1}, {')))
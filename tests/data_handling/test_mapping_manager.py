@@ -0,0 +1,87 @@
+import pytest
+from pymetatree.data_handling.disk_manager import EAWAGDiskManager
+from pymetatree.data_handling.mapping_manager import MappingManager
+from pymetatree.data_handling.models import ChemicalReaction
+
+
+@pytest.fixture
+def reactions():
+    return [
+        ChemicalReaction(smirks="CCO>>CC=O", educts=[{"smiles": "CCO"}], products=[{"smiles": "CC=O"}]),
+        ChemicalReaction(smirks="CCO>>CC=O", educts=[{"smiles": "CCO"}], products=[{"smiles": "CC=O"}]),
+        ChemicalReaction(smirks="CC=O>>CC(=O)O", educts=[{"smiles": "CC=O"}], products=[{"smiles": "CC(=O)O"}]),
+    ]
+
+
+@pytest.fixture
+def mapping_manager(reactions, tmp_path):
+    return MappingManager(reactions, EAWAGDiskManager(str(tmp_path)))
+
+
+def test_update_data(mapping_manager, reactions):
+    mapped_data = [
+        {"query_id": reactions[0].uid, "output_string": "[CH3:1][CH2:2][OH:3]>>[CH3:1][CH:2]=[O:3]"},
+        {"query_id": "unknown", "output_string": "C>>C"},
+    ]
+    mapping_manager.update_data(mapped_data)
+    assert reactions[0].mapped_smiles == mapped_data[0]["output_string"]
+    assert reactions[1].mapped_smiles == mapped_data[0]["output_string"]
+    assert reactions[2].mapped_smiles is None
+
+
+def test_generate_list_to_map(mapping_manager, reactions):
+    list_to_map = mapping_manager.generate_list_to_map()
+    assert list_to_map[2] == {"input_string": "CC=O>>CC(=O)O", "query_id": reactions[2].uid}
+    assert len(list_to_map) == 3
+
+
+def test_read_mapped_smi(tmp_path):
+    smi_file = tmp_path / "mapped.smi"
+    smi_file.write_text("[CH3:1][OH:2]>>[CH2:1]=[O:2] uid1\n\ninvalid line here\nnouid\nCC>>C uid2 \n"
+                        "CCC>>CC \t uid3\n")
+    assert MappingManager.read_mapped_smi(str(smi_file)) == [
+        {'query_id': 'uid1', 'output_string': '[CH3:1][OH:2]>>[CH2:1]=[O:2]'},
+        {'query_id': 'uid2', 'output_string': 'CC>>C'},
+        {'query_id': 'uid3', 'output_string': 'CCC>>CC'},
+    ]
+
+
+def test_save_list_to_disk(mapping_manager, tmp_path):
+    mapping_manager.save_list_to_disk("list_to_map.json")
+    assert mapping_manager.disk_manager.load_json_data("list_to_map.json") == mapping_manager.generate_list_to_map()
+
+
+def test_load_mapped_smi_and_update_data(mapping_manager, reactions, tmp_path):
+    smi_file = tmp_path / "mapped.smi"
+    smi_file.write_text(f"[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O {reactions[2].uid}\n")
+    mapping_manager.load_list_from_disk(str(smi_file), "smi")
+    mapping_manager.update_data(mapping_manager.mapped_list)
+    assert reactions[2].mapped_smiles == "[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O"
+    with pytest.raises(FileNotFoundError):
+        mapping_manager.load_list_from_disk(str(tmp_path / "missing.smi"), "smi")
+
+
+def test_update_data_sees_in_place_changes(mapping_manager, reactions):
+    appended = ChemicalReaction(smirks="CC>>C=C", educts=[{"smiles": "CC"}], products=[{"smiles": "C=C"}])
+    replaced = reactions[2]
+    replacement = ChemicalReaction(smirks="CCC>>C=CC", educts=[{"smiles": "CCC"}], products=[{"smiles": "C=CC"}])
+    reactions.append(appended)
+    reactions[2] = replacement
+    mapping_manager.update_data([
+        {"query_id": appended.uid, "output_string": "[CH3:1][CH3:2]>>[CH2:1]=[CH2:2]"},
+        {"query_id": replaced.uid, "output_string": "[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O"},
+        {"query_id": replacement.uid, "output_string": "[CH3:1][CH2:2][CH3:3]>>[CH2:1]=[CH:2][CH3:3]"},
+    ])
+    assert appended.mapped_smiles == "[CH3:1][CH3:2]>>[CH2:1]=[CH2:2]"
+    assert replaced.mapped_smiles is None
+    assert replacement.mapped_smiles == "[CH3:1][CH2:2][CH3:3]>>[CH2:1]=[CH:2][CH3:3]"
+
+
+def test_load_smi_list_can_be_applied_twice(mapping_manager, reactions, tmp_path):
+    smi_file = tmp_path / "mapped.smi"
+    smi_file.write_text(f"[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O {reactions[2].uid}\n")
+    mapping_manager.load_list_from_disk(str(smi_file), "smi")
+    mapping_manager.update_data(mapping_manager.mapped_list)
+    reactions[2].mapped_smiles = None
+    mapping_manager.update_data(mapping_manager.mapped_list)
+    assert reactions[2].mapped_smiles == "[CH3:1][CH:2]=[O:3]>>[CH3:1][C:2](=[O:3])O"
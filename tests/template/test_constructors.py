@@ -1,21 +1,41 @@
 import pytest
+from rdkit.Chem import rdChemReactions
+from pymetatree.template import constructors
 from pymetatree.template.constructors import TemplateConstructor
 from pymetatree.template.models import Template
 from pymetatree.data_handling.models import ChemicalReaction, Molecule, EnzymeClass, Pathway
 
+REACTION_STRING = "[CH3:1][C:2]([OH:3])=[O:4].[CH3:6][NH2:5]>>[CH3:6][NH:5][C:2]([CH3:1])=[O:4].[OH2:3]"
+ACID = "[C;D1;H3:1]-[C;H0;D3;+0:2](=[O;D1;H0:3])-[OH;D1;+0:4].[C;D1;H3:5]-[NH2;D1;+0:6]"
+AMIDE = "[C;D1;H3:1]-[C;H0;D3;+0:2](=[O;D1;H0:3])-[NH;D2;+0:6]-[C;D1;H3:5].[OH2;D0;+0:4]"
+EXPECTED_RWD_SMARTS = f"{AMIDE}>>{ACID}"
+EXPECTED_FWD_SMARTS = f"{ACID}>>{AMIDE}"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def template_constructor():
     return TemplateConstructor()
 
 
+@pytest.fixture
+def fast_constructor(monkeypatch):
+    fake_output = {"products": "P", "reactants": "R", "reaction_smarts": "P>>R"}
+    monkeypatch.setattr(constructors, "extract_rdchiral_template_raw", lambda rdchiral_input: fake_output)
+    return TemplateConstructor()
+
+
+@pytest.fixture(scope="session")
+def sample_template(template_constructor):
+    return template_constructor.extract_from_string(REACTION_STRING)
+
+
 @pytest.fixture
 def sample_chemical_reaction():
     return ChemicalReaction(
         dataset="test_dataset",
         description="Test reaction",
         enzyme_classes=[EnzymeClass(enzyme_class_name="Test Enzyme", enzyme_class_number="1.1.1.1")],
-        mapped_smiles="[CH3:1][C:2]([OH:3])=[O:4].[CH3:6][NH2:5]>>[CH3:6][NH:5][C:2]([CH3:1])=[O:4].[OH2:3]",
+        mapped_smiles=REACTION_STRING,
         multistep_flag=False,
         name="Test Reaction",
         pathways=[Pathway(uid="P001")],
@@ -26,26 +46,26 @@ def sample_chemical_reaction():
     )
 
 
-def test_extract_from_string(template_constructor):
-    reaction_string = "[CH3:1][C:2]([OH:3])=[O:4].[CH3:6][NH2:5]>>[CH3:6][NH:5][C:2]([CH3:1])=[O:4].[OH2:3]"
-    template = template_constructor.extract_from_string(reaction_string=reaction_string)
+def test_extract_from_string(sample_template):
+    template = sample_template
 
     assert isinstance(template, Template)
-    assert template.reaction_string == reaction_string
+    assert template.reaction_string == REACTION_STRING
     assert template.products_template is not None
     assert template.reactants_template is not None
-    assert template.template_rwd_smarts is not None
-    assert template.template_fwd_smarts is not None
-    assert template.template_fwd_smarts == ">".join(template.template_rwd_smarts.split(">")[::-1])
+    assert template.template_rwd_smarts == EXPECTED_RWD_SMARTS
+    assert template.template_fwd_smarts == EXPECTED_FWD_SMARTS
 
 
-def test_extract_from_chemical_reaction_object(template_constructor, sample_chemical_reaction):
-    updated_reaction = template_constructor.extract_from_chemical_reaction_object(sample_chemical_reaction)
+def test_extract_from_chemical_reaction_object(fast_constructor, sample_chemical_reaction):
+    updated_reaction = fast_constructor.extract_from_chemical_reaction_object(sample_chemical_reaction)
 
     assert isinstance(updated_reaction, ChemicalReaction)
     assert updated_reaction.template is not None
     assert isinstance(updated_reaction.template, Template)
     assert updated_reaction.template.reaction_string == sample_chemical_reaction.mapped_smiles
+    assert updated_reaction.template.template_rwd_smarts == "P>>R"
+    assert updated_reaction.template.template_fwd_smarts == "R>>P"
 
 
 def test_invalid_reaction_string(template_constructor):
@@ -58,13 +78,14 @@ def test_empty_reaction_string(template_constructor):
         template_constructor.extract_from_string("")
 
 
-def test_template_properties(template_constructor):
-    reaction_string = "[CH3:1][C:2]([OH:3])=[O:4].[CH3:6][NH2:5]>>[CH3:6][NH:5][C:2]([CH3:1])=[O:4].[OH2:3]"
-    template = template_constructor.extract_from_string(reaction_string)
+def test_template_properties(sample_template):
+    template = sample_template
 
     assert template.uid is not None
     assert isinstance(template.uid, str)
     assert len(template.uid) > 0
+    assert template.uid is template.uid
+    assert template.model_dump()["uid"] == template.uid
 
 
 def test_extract_and_set_template(template_constructor, sample_chemical_reaction):
@@ -76,3 +97,56 @@ def test_extract_and_set_template(template_constructor, sample_chemical_reaction
     assert updated_reaction.template.reactants_template is not None
     assert updated_reaction.template.template_rwd_smarts is not None
     assert updated_reaction.template.template_fwd_smarts is not None
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_extract_batch(sample_chemical_reaction, sample_template, n_jobs):
+    reactions = TemplateConstructor.extract_batch([sample_chemical_reaction], n_jobs=n_jobs)
+    assert reactions == [sample_chemical_reaction]
+    assert isinstance(sample_chemical_reaction.template, Template)
+    assert sample_chemical_reaction.template.model_dump() == sample_template.model_dump()
+
+
+@pytest.mark.parametrize("reaction_string", ["CCO>>CC=O", "[CH3:1][OH:2]>>[CH3:1][OH:2]"])
+def test_extract_from_string_without_template(template_constructor, reaction_string):
+    template = template_constructor.extract_from_string(reaction_string)
+    assert template.reaction_string == reaction_string
+    assert template.template_rwd_smarts == ""
+    assert template.template_fwd_smarts == ""
+
+
+def test_extract_batch_is_independent_of_n_jobs(sample_chemical_reaction):
+    serial = TemplateConstructor.extract_batch([sample_chemical_reaction.model_copy()], n_jobs=1)
+    parallel = TemplateConstructor.extract_batch([sample_chemical_reaction.model_copy()], n_jobs=2)
+    assert parallel[0].template == serial[0].template
+    assert parallel[0].template.model_fields_set == serial[0].template.model_fields_set
+    assert parallel[0].template.uid == serial[0].template.uid
+
+
+def test_extract_batch_without_template(sample_chemical_reaction):
+    sample_chemical_reaction.mapped_smiles = "CCO>>CC=O"
+    TemplateConstructor.extract_batch([sample_chemical_reaction], n_jobs=2)
+    assert sample_chemical_reaction.template.template_fwd_smarts == ""
+
+
+def test_template_uid_follows_reaction_string(sample_template):
+    template = sample_template.model_copy()
+    assert template.uid == sample_template.uid
+    template.reaction_string = "CCO>>CC=O"
+    assert template.uid == template.model_dump()["uid"] != sample_template.uid
+    copied = sample_template.model_copy(update={"reaction_string": "CCO>>CC=O"})
+    assert copied.uid == template.uid
+    assert sample_template.model_copy() == sample_template
+
+
+def test_template_reactions_follow_smarts(sample_template):
+    template = sample_template.model_copy()
+    forward_rdrxn = template.rxn_fwd
+    assert template.rxn_fwd is forward_rdrxn
+    template.template_fwd_smarts = "[C:1]>>[C:1]O"
+    assert template.rxn_fwd is not forward_rdrxn
+    assert rdChemReactions.ReactionToSmarts(template.rxn_fwd) == "[C:1]>>[C:1]O"
+    backward_rdrxn = template.rxn_rwd
+    template.template_rwd_smarts = "[C:1]O>>[C:1]"
+    assert rdChemReactions.ReactionToSmarts(template.rxn_rwd) == "[C:1]O>>[C:1]"
+    assert template.rxn_rwd is not backward_rdrxn
@@ -2,7 +2,7 @@ from pymetatree.template.models import (
     RDChiralTemplateExtractorInput,
     RDChiralTemplateExtractorOutput,
 )
-from pymetatree.template.extractor import extract_rdchiral_template
+from pymetatree.template.extractor import extract_rdchiral_template, extract_rdchiral_template_raw
 
 
 def test_build_rdchiral_input_from_smiles_without_id():
@@ -31,3 +31,25 @@ def test_extract_rdchiral_template():
     rdchiral_output = extract_rdchiral_template(rdchiral_input=rdchiral_input)
     assert isinstance(rdchiral_output, RDChiralTemplateExtractorOutput)
     print(rdchiral_output)
+
+
+def test_extract_rdchiral_template_raw():
+    mapped_smiles = "[CH3:1][CH2:2][NH:3][CH3:4]>>[CH3:1][CH2:2][NH2+1:3][CH3:4]"
+    rdchiral_input = RDChiralTemplateExtractorInput.from_smiles(
+        rxn_smiles=mapped_smiles, _id="RXN_001"
+    )
+    raw_output = extract_rdchiral_template_raw(rdchiral_input=rdchiral_input)
+    assert isinstance(raw_output, dict)
+    assert raw_output == extract_rdchiral_template(rdchiral_input=rdchiral_input).to_dict()
+
+
+def test_extract_rdchiral_template_raw_is_cached():
+    mapped_smiles = "[CH3:1][CH2:2][NH:3][CH3:4]>>[CH3:1][CH2:2][NH2+1:3][CH3:4]"
+    rdchiral_input = RDChiralTemplateExtractorInput.from_smiles(
+        rxn_smiles=mapped_smiles, _id="RXN_002"
+    )
+    first = extract_rdchiral_template_raw(rdchiral_input=rdchiral_input)
+    first["reaction_smarts"] = "modified"
+    second = extract_rdchiral_template_raw(rdchiral_input=rdchiral_input)
+    assert second["reaction_smarts"] != "modified"
+    assert second == extract_rdchiral_template(rdchiral_input=rdchiral_input).to_dict()
@@ -5,3 +5,14 @@ def test_version():
     version = pymetatree.__version__
 
     assert version is not None
+
+
+def test_lazy_public_attributes():
+    from pymetatree.blueprint.blueprint_handler import BlueprintHandler
+
+    assert pymetatree.BlueprintHandler is BlueprintHandler
+    assert "BlueprintHandler" in dir(pymetatree)
+
+
+def test_all_lists_the_lazy_attributes():
+    assert sorted(pymetatree.__all__) == sorted(["__version__", *pymetatree._LAZY_ATTRIBUTES])
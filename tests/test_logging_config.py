@@ -0,0 +1,29 @@
+from loguru import logger
+
+from pymetatree import logging_config
+
+
+def test_configure_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_config, "_SINK_ID", None)
+    log_file = tmp_path / "pymetatree.log"
+    logging_config.configure_once(str(log_file))
+    sink_id = logging_config._SINK_ID
+    try:
+        logging_config.configure_once(str(tmp_path / "other.log"))
+        assert logging_config._SINK_ID == sink_id
+        logger.info("configured")
+    finally:
+        logger.remove(sink_id)
+    assert log_file.read_text().count("configured") == 1
+    assert not (tmp_path / "other.log").exists()
+
+
+def test_remove_file_sink(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_config, "_SINK_ID", None)
+    log_file = tmp_path / "pymetatree.log"
+    logging_config.configure_once(str(log_file))
+    logging_config.remove_file_sink()
+    assert logging_config._SINK_ID is None
+    logger.info("not written")
+    assert not log_file.exists()
+    logging_config.remove_file_sink()